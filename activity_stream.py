@@ -67,6 +67,8 @@ class AYActivityStream(AYContainer):
 
     signals = ActivityStreamSignals()
     Categories = Literal["all", "comment", "version.publish", "checklist"]
+    # number of activity widgets built at once, see _fetch_more.
+    BATCH_SIZE = 20
 
     def __init__(
         self,
@@ -87,6 +89,8 @@ class AYActivityStream(AYContainer):
         self._version = VersionData.not_set()
         self._activities = ActivityData()
         self._category = category
+        # activities of the current category without a widget yet.
+        self._pending: list = []
 
         super().__init__(
             *args,
@@ -186,6 +190,10 @@ class AYActivityStream(AYContainer):
         self.scroll_area.setWidget(self.scroll_ctnr)
         self.scroll_area.setWidgetResizable(True)
 
+        bar = self.scroll_area.verticalScrollBar()
+        bar.valueChanged.connect(self._fetch_more)
+        bar.rangeChanged.connect(self._fetch_more)
+
         return self.scroll_area
 
     def _build(self) -> None:
@@ -203,7 +211,8 @@ class AYActivityStream(AYContainer):
         """Update the activity stream with new activities.
 
         Clears the current stream and populates it with activities matching
-        the specified category.
+        the specified category. Only the first activities get a widget
+        right away, the next ones are built as the stream is scrolled.
 
         Args:
             category (str): The activity category to filter by.
@@ -212,6 +221,7 @@ class AYActivityStream(AYContainer):
                 category.
         """
         self._category = category
+        self._pending = []
         clear_layout(self.scroll_ctnr)
 
         if category == "details":
@@ -225,29 +235,55 @@ class AYActivityStream(AYContainer):
             self.scroll_ctnr.add_layout(form)
             return
 
-        for event in activities.activity_list:
-            if category not in {"all", event.type}:
-                continue
-            if isinstance(event, CommentModel):
-                comment = AYComment(
-                    self, data=event, user_list=self._project.users
-                )
-                self.scroll_ctnr.add_widget(comment)
-                # connect signals
-                comment.comment_deleted.connect(self._on_comment_deleted)
-                comment.comment_edited.connect(
-                    self.signals.comment_edited.emit
-                )
-            elif isinstance(event, VersionPublishModel):
-                self.scroll_ctnr.add_widget(
-                    AYPublish(self, data=event), stretch=0
-                )
-            elif isinstance(event, StatusChangeModel):
-                self.scroll_ctnr.add_widget(
-                    AYStatusChange(self, data=event), stretch=0
-                )
+        self._pending = [
+            event
+            for event in activities.activity_list
+            if category in {"all", event.type}
+        ]
         self.scroll_ctnr.addStretch(100)
         self._activities = activities
+        self._build_batch()
+
+    def _build_activity(self, event) -> QWidget | None:
+        """Return the widget displaying an activity event."""
+        if isinstance(event, CommentModel):
+            comment = AYComment(
+                self, data=event, user_list=self._project.users
+            )
+            # connect signals
+            comment.comment_deleted.connect(self._on_comment_deleted)
+            comment.comment_edited.connect(self.signals.comment_edited.emit)
+            return comment
+        if isinstance(event, VersionPublishModel):
+            return AYPublish(self, data=event)
+        if isinstance(event, StatusChangeModel):
+            return AYStatusChange(self, data=event)
+        return None
+
+    def _build_batch(self) -> None:
+        """Build the widgets of the next pending activities."""
+        batch = self._pending[: self.BATCH_SIZE]
+        del self._pending[: self.BATCH_SIZE]
+        for event in batch:
+            widget = self._build_activity(event)
+            if widget:
+                # keep the trailing stretch last.
+                self.scroll_ctnr.insert_widget(
+                    self.scroll_ctnr.count() - 1, widget
+                )
+
+    def _fetch_more(self) -> None:
+        """Build more activities when the end of the stream is less than a
+        viewport away, i.e. about to be scrolled into view.
+
+        Connected to the scroll bar range too, so the stream keeps building
+        batches until it fills the viewport.
+        """
+        if not self._pending:
+            return
+        bar = self.scroll_area.verticalScrollBar()
+        if bar.maximum() - bar.value() <= self.scroll_area.viewport().height():
+            self._build_batch()
 
     def on_comment_submitted(self, markdown: str, category: str) -> None:
         """Handle the submission of a new comment.
@@ -275,6 +311,9 @@ class AYActivityStream(AYContainer):
             category_color=cat.color,
             comment_date=time_stamp(),
         )
+        # the new comment goes last: build the pending activities first.
+        while self._pending:
+            self._build_batch()
         idx = self.scroll_ctnr.count() - 1
         w = AYComment(self, data=m, user_list=self._project.users)
         self.scroll_ctnr.insert_widget(idx, w)
@@ -0,0 +1,274 @@
+"""Debugging and benchmarking helpers for the AYON style.
+
+Nothing in here is used at runtime: keep it out of ayon_style so importing
+the style stays cheap.
+
+Run the style benchmark and widget gallery with:
+
+    python -m ayon_ui_qt._style_debug
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from pathlib import Path
+
+from qtpy import QtCore
+from qtpy.QtCore import QRect, QRectF
+from qtpy.QtGui import QColor, QPainter, QPen
+from qtpy.QtWidgets import QStyle
+
+from .ayon_style import _NO_BRUSH, StyleData
+
+
+def debug_rect(p: QPainter, color: str, rect: QRect | QRectF):
+    p.save()
+    p.setPen(QPen(QColor(color)))
+    p.setBrush(_NO_BRUSH)
+    p.drawRect(rect)
+    p.restore()
+
+
+def all_enums(t):
+    meta_object: QtCore.QMetaObject = t.staticMetaObject
+    enums = [
+        meta_object.enumerator(v) for v in range(meta_object.enumeratorCount())
+    ]
+    for enum in enums:
+        # enum.isFlag() is always False
+        non_empty_indices = [i for i in range(17) if enum.valueToKey(i)]
+        is_flag = non_empty_indices == [0, 1, 2, 4, 8, 16]
+
+        print(
+            f"  === {enum.scope()}.{enum.enumName()}[{enum.keyCount()}]"
+            f" -- {'Flag' if is_flag else ''}"
+        )
+
+        if is_flag:
+            for i in range(enum.keyCount()):
+                flag_idx = 2**i if i > 0 else 0
+                v = enum.valueToKey(flag_idx)
+                if v:
+                    print(f"    {flag_idx}: {v}")
+        else:
+            for i in range(enum.keyCount()):
+                print(f"    {i}: {enum.valueToKey(i)}")
+
+
+def enum_values(enum):
+    meta_object: QtCore.QMetaObject = QStyle.staticMetaObject  # type: ignore
+    enum_index = meta_object.indexOfEnumerator(enum.__name__)
+    meta_enum: QtCore.QMetaEnum = meta_object.enumerator(enum_index)
+    num_keys = meta_enum.keyCount()
+    return [v for v in range(num_keys) if meta_enum.key(v)]
+
+
+@lru_cache(maxsize=None)
+def enum_names(enum) -> dict[int, str]:
+    meta_object: QtCore.QMetaObject = QStyle.staticMetaObject  # type: ignore
+    enum_index = meta_object.indexOfEnumerator(enum.__name__)
+    meta_enum: QtCore.QMetaEnum = meta_object.enumerator(enum_index)
+    return {
+        meta_enum.value(i): meta_enum.key(i)
+        for i in range(meta_enum.keyCount())
+    }
+
+
+@lru_cache(maxsize=None)
+def enum_to_str(enum, enum_value: int, widget: str) -> str:
+    """Convert enum value to string representation."""
+    return f"{enum_names(enum).get(int(enum_value))}-{widget}"
+
+
+def dump_cache_stats(model: StyleData):
+    print(f"[StyleData] cached {len(model._cache)} styles.")
+    print(f"[StyleData]   >> {list(model._cache.keys())}")
+
+
+# TEST ========================================================================
+
+
+if __name__ == "__main__":
+    import time
+
+    from .components.buttons import AYButton
+    from .components.check_box import AYCheckBox
+    from .components.combo_box import ALL_STATUSES, AYComboBox
+    from .components.container import AYContainer
+    from .components.label import AYLabel
+    from .components.layouts import AYHBoxLayout, AYVBoxLayout
+    from .components.text_box import AYTextBox
+    from .components.user_image import AYUserImage
+    from .tester import Style, test
+    from .variants import QPushButtonVariants
+
+    def time_it(func):
+        i = time.time()
+        r = func()
+        e = (time.time() - i) * 1000
+        return r, e
+
+    m, e = time_it(StyleData)
+    print(f"  init time: {e:.6f} ms")
+
+    print("> button-surface-base: -------------------------------------------")
+    d, e = time_it(lambda: m.get_style("QPushButton", "surface", "base"))
+    print(f"  style time: {e:.6f} ms")
+
+    print("> button-surface-hover -------------------------------------------")
+    d, e = time_it(lambda: m.get_style("QPushButton", "surface", "hover"))
+    print(f"  style time: {e:.6f} ms")
+
+    d, e = time_it(lambda: m.get_style("QPushButton", "surface", "hover"))
+    print(f"  cached style time: {e:.6f} ms")
+
+    dump_cache_stats(m)
+
+    print("> enum_to_str benchmarking --------------------------------------")
+    ee = 0
+    i = 0
+    s = ""
+    vals = enum_values(QStyle.ControlElement)
+    for i, v in enumerate(vals):
+        s, e = time_it(lambda: enum_to_str(QStyle.ControlElement, v, ""))
+        ee += e
+    ee /= i
+    print(f"  enum_to_str = {s!r}: {ee:.6f} ms ({i} lookups)")
+    s = ""
+    ee = 0
+    runs = 1000
+    for i in range(runs):
+        for i, v in enumerate(vals):
+            s, e = time_it(
+                lambda: enum_to_str(
+                    QStyle.ControlElement,
+                    QStyle.ControlElement.CE_PushButtonBevel,
+                    "",
+                )
+            )
+            ee += e
+    total_runs = runs * len(vals)
+    ee /= total_runs
+    print(f"  cached enum_to_str = {s!r}: {ee:.6f} ms ({total_runs} runs)")
+
+    # all_enums(QStyle)
+
+    print("> ui test --------------------------------------------------------")
+
+    def _ui_test():
+        # Create and show the test widget
+        widget = AYContainer(
+            layout=AYContainer.Layout.VBox,
+            variant=AYContainer.Variants.Default,
+            margin=0,
+            layout_spacing=10,
+            layout_margin=10,
+        )
+
+        container_1 = AYContainer(
+            widget,
+            layout=AYContainer.Layout.VBox,
+            variant=AYContainer.Variants.Low,
+            margin=0,
+            layout_margin=10,
+            layout_spacing=10,
+        )
+        widget.add_widget(container_1)
+
+        variants = [v for v in QPushButtonVariants]
+
+        # text buttons
+        l1 = AYHBoxLayout(margin=0)
+        for i, var in enumerate(variants):
+            b = AYButton(
+                f"{var.value} button",
+                variant=var,
+                tooltip=f"using variant {var.value}...",
+            )
+            l1.addWidget(b)
+        container_1.add_layout(l1)
+
+        # text + icon buttons
+        l2 = AYHBoxLayout(margin=0)
+        for i, var in enumerate(variants):
+            b = AYButton(f"{var.value} button", variant=var, icon="add")
+            l2.addWidget(b)
+        container_1.add_layout(l2)
+
+        container_2 = AYContainer(
+            layout=AYContainer.Layout.HBox,
+            variant=AYContainer.Variants.Low,
+            margin=0,
+            layout_margin=10,
+            layout_spacing=10,
+        )
+        # icon buttons
+        for i, var in enumerate(variants):
+            b = AYButton(
+                variant=var, icon="add", name_id="ICON_ONLY" if i == 0 else ""
+            )
+            container_2.add_widget(b)
+        container_2.addStretch()
+        widget.add_widget(container_2)
+
+        container_3 = AYContainer(
+            layout=AYContainer.Layout.HBox,
+            variant=AYContainer.Variants.Low,
+            margin=0,
+            layout_margin=10,
+            layout_spacing=10,
+        )
+        te = AYTextBox()
+        te.set_markdown(
+            "## Title\nText can be **bold** or *italic*, as expected !\n"
+            "- [ ] Do this\n- [ ] Do that\n"
+        )
+        container_3.add_widget(te)
+        vblyt = AYVBoxLayout(spacing=8)
+        cbb = AYComboBox(items=ALL_STATUSES)
+        vblyt.addWidget(cbb)
+        cbbi = AYComboBox(items=ALL_STATUSES, inverted=True)
+        vblyt.addWidget(cbbi)
+        cb = AYCheckBox("CheckBox")
+        cb.setToolTip(("A typical switch..."))
+        vblyt.addWidget(cb)
+        vblyt.addWidget(AYLabel("Normal label", tool_tip="text only"))
+        vblyt.addWidget(
+            AYLabel("Dimmed label", dim=True, tool_tip="text dimmed")
+        )
+        vblyt.addWidget(
+            AYLabel(
+                "Icon + text label", icon="favorite", tool_tip="Icon and text"
+            )
+        )
+        vblyt.addWidget(
+            AYLabel(
+                icon="token",
+                icon_color="#ff8800",
+                icon_size=32,
+                tool_tip="32 px orange icon only",
+            )
+        )
+        vblyt.addWidget(
+            AYLabel(
+                "a badge",
+                icon_color="#0088ff",
+                variant=AYLabel.Variants.Badge,
+                tool_tip="a blue badge",
+            )
+        )
+        usr_ly = AYHBoxLayout(spacing=8)
+        usr_ly.addWidget(
+            AYUserImage(
+                src=Path(__file__).parent.joinpath("resources", "avatar1.jpg")
+            )
+        )
+        vblyt.addStretch()
+        container_3.add_layout(vblyt)
+        container_3.addStretch()
+
+        widget.add_widget(container_3)
+
+        return widget
+
+    test(_ui_test, style=Style.AyonStyleOverCSS)
@@ -3,13 +3,16 @@ from __future__ import annotations
 import copy
 import json
 import logging
-from functools import partial
+import zlib
+from functools import lru_cache, partial
 from pathlib import Path
 
 from qtpy import QtCore, QtGui, QtWidgets
 from qtpy.QtCore import QRect, QRectF, QSize, Qt
 from qtpy.QtGui import QBrush, QColor, QPainter, QPainterPath, QPalette, QPen
 from qtpy.QtWidgets import (
+    QAbstractItemView,
+    QAbstractSlider,
     QApplication,
     QCheckBox,
     QComboBox,
@@ -36,6 +39,11 @@ try:
 except ImportError:
     from .vendor.qtmaterialsymbols import get_icon
 
+try:
+    from orjson import loads as _json_loads  # type: ignore
+except ImportError:
+    _json_loads = json.loads
+
 from .components.combo_box import Item
 # from .components.color import AYColor
 
@@ -45,93 +53,131 @@ logging.basicConfig(
 )
 log = logging.getLogger("Ayon Style")
 
-
-# DEBUG -----------------------------------------------------------------------
-
-
-def _debug_rect(p: QPainter, color: str, rect: QRect | QRectF):
-    p.save()
-    pen = QPen(QColor(color))
-    brush = QBrush(Qt.BrushStyle.NoBrush)
-    p.setPen(pen)
-    p.setBrush(brush)
-    p.drawRect(rect)
-    p.restore()
-
-
-def _style_font(style: dict, w: QWidget | None) -> QtGui.QFont:
+# Frequently used Qt enum values, resolved once.
+_NO_PEN = Qt.PenStyle.NoPen
+_NO_BRUSH = Qt.BrushStyle.NoBrush
+_ALIGN_CENTER = Qt.AlignmentFlag.AlignCenter
+_RH_AA = QPainter.RenderHint.Antialiasing
+_ICON_NORMAL = QtGui.QIcon.Mode.Normal
+_ICON_DISABLED = QtGui.QIcon.Mode.Disabled
+_ICON_ACTIVE = QtGui.QIcon.Mode.Active
+_ICON_SELECTED = QtGui.QIcon.Mode.Selected
+# default for dict lookups where any stored value is valid.
+_MISS = object()
+# shared return values, Qt copies them on return.
+_EMPTY_SIZE = QSize()
+_DEFAULT_CONTENT_SIZE = QSize(100, 32)
+
+
+@lru_cache(maxsize=64)
+def _font_and_metrics(
+    family: str, pt_size: float, weight: int
+) -> tuple[QtGui.QFont, QtGui.QFontMetrics]:
     font = QtGui.QFont()
-    font.setFamily(style["font-family"])
-    pt_size = w.font().pointSizeF() if w else style["font-size"]
+    font.setFamily(family)
     font.setPointSizeF(pt_size)
-    font.setWeight(QtGui.QFont.Weight(style["font-weight"]))
+    font.setWeight(QtGui.QFont.Weight(weight))
     log.debug(
         "FONT: %s, %g pts, w=%d",
         font.family(),
         font.pointSizeF(),
         font.weight(),
     )
-    return font
-
-
-def _all_enums(t):
-    meta_object: QtCore.QMetaObject = t.staticMetaObject
-    enums = [
-        meta_object.enumerator(v) for v in range(meta_object.enumeratorCount())
-    ]
-    for enum in enums:
-        # enum.isFlag() is always False
-        non_empty_indices = [i for i in range(17) if enum.valueToKey(i)]
-        is_flag = non_empty_indices == [0, 1, 2, 4, 8, 16]
-
-        print(
-            f"  === {enum.scope()}.{enum.enumName()}[{enum.keyCount()}] -- {'Flag' if is_flag else ''}"
-        )
-
-        if is_flag:
-            for i in range(enum.keyCount()):
-                flag_idx = 2**i if i > 0 else 0
-                v = enum.valueToKey(flag_idx)
-                if v:
-                    print(f"    {flag_idx}: {v}")
-        else:
-            for i in range(enum.keyCount()):
-                print(f"    {i}: {enum.valueToKey(i)}")
+    return font, QtGui.QFontMetrics(font)
 
 
-def _enum_values(enum):
-    # qmeta = QtCore.QMetaEnum(enum)
-    meta_object: QtCore.QMetaObject = QStyle.staticMetaObject  # type: ignore
-    enum_index = meta_object.indexOfEnumerator(enum.__name__)
-    meta_enum: QtCore.QMetaEnum = meta_object.enumerator(enum_index)
-    num_keys = meta_enum.keyCount()
-    vals = [v for v in range(num_keys) if meta_enum.key(v)]
-    # print(f"=== enum = {meta_enum.scope()}.{meta_enum.enumName()} -> {keys}")
-    return vals
+@lru_cache(maxsize=2048)
+def _text_size(
+    family: str, pt_size: float, weight: int, text: str
+) -> tuple[int, int]:
+    rect = _font_and_metrics(family, pt_size, weight)[1].boundingRect(text)
+    return rect.width(), rect.height()
 
 
-def enum_to_str(enum, enum_value: int, widget: str) -> str:
-    """Convert enum value to string representation."""
-    cachekey = f"{enum.__name__}_{enum_value}_{widget}"
+def _style_font_key(style: dict, w: QWidget | None) -> tuple[str, float, int]:
+    pt_size = w.font().pointSizeF() if w else style["font-size"]
+    return style["font-family"], pt_size, style["font-weight"]
+
+
+def _style_font(
+    style: dict, w: QWidget | None
+) -> tuple[QtGui.QFont, QtGui.QFontMetrics]:
+    """Return the shared font and font metrics for a style. Callers must
+    not modify them."""
+    return _font_and_metrics(*_style_font_key(style, w))
+
+
+@lru_cache(maxsize=256)
+def _parse_color(value: str) -> QColor:
+    return QColor(value)
+
+
+def _qcolor(value) -> QColor:
+    """Return a shared QColor for a style color value. It is cached, so
+    copy it before modifying it."""
+    if isinstance(value, QColor):
+        return value
+    return _parse_color(value)
+
+
+@lru_cache(maxsize=None)
+def _solid_brush(rgba: int) -> QBrush:
+    return QBrush(QColor.fromRgba(rgba))
+
+
+@lru_cache(maxsize=256)
+def _rounded_rect_pixmap(
+    width: int, height: int, radius: int, rgba: int, dpr: float
+) -> QtGui.QPixmap:
+    """Render a filled, antialiased rounded rect once so identical button
+    backgrounds can be blitted instead of rasterized on every paint."""
+    pm = QtGui.QPixmap(round(width * dpr), round(height * dpr))
+    pm.setDevicePixelRatio(dpr)
+    pm.fill(Qt.GlobalColor.transparent)
+    p = QPainter(pm)
+    p.setRenderHint(_RH_AA)
+    p.setPen(_NO_PEN)
+    p.setBrush(_solid_brush(rgba))
+    p.drawRoundedRect(QRect(0, 0, width, height), radius, radius)
+    p.end()
+    return pm
+
+
+# (icon cacheKey, width, height, mode, state, dpr) -> rendered pixmap
+_ICON_PIXMAPS: dict[tuple, QtGui.QPixmap] = {}
+_ICON_PIXMAPS_MAX = 512
+
+
+def _paint_icon(
+    painter: QPainter,
+    icon: QtGui.QIcon,
+    rect: QRect,
+    mode: QtGui.QIcon.Mode,
+    state: QtGui.QIcon.State = QtGui.QIcon.State.Off,
+) -> None:
+    """Paint icon in rect from a pixmap rendered once per size, mode and
+    state, instead of letting font icons redraw their glyph every time."""
+    dpr = painter.device().devicePixelRatioF()
+    key = (icon.cacheKey(), rect.width(), rect.height(), mode, state, dpr)
     try:
-        return enum_to_str._cache[cachekey]  # type: ignore
-    except AttributeError:
-        enum_to_str._cache = {}  # type: ignore
+        pm = _ICON_PIXMAPS[key]
     except KeyError:
-        pass
+        if len(_ICON_PIXMAPS) >= _ICON_PIXMAPS_MAX:
+            _ICON_PIXMAPS.clear()
+        pm = _ICON_PIXMAPS[key] = icon.pixmap(rect.size(), dpr, mode, state)
+    painter.drawPixmap(rect.topLeft(), pm)
 
-    try:
-        enum_to_str._cache[cachekey] = enum.valueToKey(enum_value)  # type: ignore
-    except AttributeError:
-        meta_object = QStyle.staticMetaObject  # type: ignore
-        enum_index = meta_object.indexOfEnumerator(enum.__name__)
-        meta_enum = meta_object.enumerator(enum_index)
-        enum_to_str._cache[cachekey] = (  # type: ignore
-            f"{meta_enum.valueToKey(enum_value)}-{widget}"  # type: ignore
-        )
-        # print(f'{cachekey}: {enum_to_str._cache[cachekey]}')
 
-    return enum_to_str._cache[cachekey]  # type: ignore
+def dispatch_key(enum, enum_value: int, widget: str) -> tuple:
+    """Build the drawer/sizer/metric table key for an enum value and a
+    widget key.
+
+    The enum class is part of the key because values of different QStyle
+    enums overlap (CE_PushButton == PE_Frame == 0). Qt's enum members hash
+    and compare like their int value, so the enum member Qt passes to the
+    style finds the same entry.
+    """
+    return (enum, int(enum_value), widget)
 
 
 def hsl_to_html_color(hsl: str):
@@ -146,27 +192,59 @@ def do_nothing(*args, **kwargs):
     pass
 
 
+@lru_cache(maxsize=1)
+def _load_style_json() -> dict:
+    """Load ayon_style.json once and resolve its palette.
+
+    The returned data is shared by all StyleData instances and must be
+    treated as read-only.
+    """
+    fpath = Path(__file__).parent / "ayon_style.json"
+    raw = fpath.read_bytes()
+    try:
+        # generated by create_package.py, skips json parsing entirely
+        from .ayon_style_data import DATA, SOURCE_CRC32
+    except ImportError:
+        data = _json_loads(raw)
+    else:
+        if SOURCE_CRC32 == zlib.crc32(raw):
+            data = dict(DATA, palette=dict(DATA.get("palette", {})))
+        else:
+            log.debug("ayon_style_data.py is stale, parsing json instead")
+            data = _json_loads(raw)
+    # Palette values can reference each other
+    palette = data.get("palette", {})
+    for k, v in palette.items():
+        if v.startswith("hsl("):
+            palette[k] = hsl_to_html_color(v)
+    # Follow reference chains until no value changes. No chain can be
+    # longer than the palette, so the pass count is bounded by its size.
+    for _ in range(len(palette)):
+        changed = False
+        for k, v in palette.items():
+            nv = palette.get(v, v)
+            if nv != v:
+                palette[k] = nv
+                changed = True
+        if not changed:
+            break
+    # anything still pointing into the palette is part of a cycle.
+    cycle = sorted(k for k, v in palette.items() if v in palette)
+    if cycle:
+        raise ValueError(f"Circular palette values in {', '.join(cycle)}")
+    return data
+
+
 # ----------------------------------------------------------------------------
 
 
 class StyleData:
     def __init__(self) -> None:
-        fpath = Path(__file__).parent / "ayon_style.json"
-        with open(fpath, "r") as fh:
-            self.data = json.load(fh)
-        # Palette values can reference each other
+        self.data = copy.copy(_load_style_json())
         self._palette = self.data.get("palette", {})
-        for k, v in self._palette.items():
-            if v.startswith("hsl("):
-                self._palette[k] = hsl_to_html_color(v)
-        for k, v in self._palette.items():
-            self.data["palette"][k] = self.data["palette"].get(v, v)
-        for k, v in self._palette.items():
-            if v in self._palette:
-                raise ValueError(f"Unresolved palette value in {k}")
         # cache
         self._cache = {}
-        self.last_key = ""
+        self.last_key: tuple = ()
         # base palette
         self.base_palette = self._build_palette()
 
@@ -197,12 +275,8 @@ class StyleData:
             )
         return p
 
-    def dump_cache_stats(self):
-        print(f"[StyleData] cached {len(self._cache)} styles.")
-        print(f"[StyleData]   >> {list(self._cache.keys())}")
-
     def widget_variants(self, widget):
-        return list(self.data["widgets"][widget]["variants"].keys())
+        return self.data["widgets"][widget]["variants"]
 
     def widget_data(self, widget):
         return self.data["widgets"].get(widget, {})
@@ -211,12 +285,13 @@ class StyleData:
         return list(self.data["widgets"].keys())
 
     def default_variant(self, widget_data):
-        return widget_data.get(
-            "default-variant", list(widget_data.get("variants", {}).keys())[0]
-        )
+        try:
+            return widget_data["default-variant"]
+        except KeyError:
+            return next(iter(widget_data.get("variants", {})))
 
     def validate_variant(self, widget_data, variant):
-        if variant not in widget_data.get("variants", {}).keys():
+        if variant not in widget_data.get("variants", {}):
             return self.default_variant(widget_data)
         return variant
 
@@ -231,7 +306,7 @@ class StyleData:
     ):
         """Returns a style for a widget, variant and state."""
         try:
-            return self._cache[f"{widget_cls}-{variant}-{state}"]
+            return self._cache[(widget_cls, variant, state)]
         except KeyError:
             pass
 
@@ -239,15 +314,19 @@ class StyleData:
         vrt = self.validate_variant(data, variant)
         dvrt = self.default_variant(data)
         pal = self.palette()
-        d = copy.copy(self.data["global"])
-        d.update(copy.deepcopy(data.get("variants", {}).get(dvrt, {})))
-        d.update(copy.deepcopy(data.get("variants", {}).get(vrt, {})))
+        # Shallow merge: the loaded data is never modified, nested state
+        # dicts are rebuilt below instead of being written to.
+        variants = data.get("variants", {})
+        d = {
+            **self.data["global"],
+            **variants.get(dvrt, {}),
+            **variants.get(vrt, {}),
+        }
 
         if state == "all":
             for key, val in d.items():
                 if isinstance(val, dict):
-                    for kk, vv in val.items():
-                        d[key][kk] = pal.get(vv, vv)
+                    d[key] = {kk: pal.get(vv, vv) for kk, vv in val.items()}
                 elif isinstance(val, list):
                     pass
                 else:
@@ -257,7 +336,7 @@ class StyleData:
             # all states. That way, we can directly use "background-color" without
             # checking the widget's state.
             to_be_removed = []
-            for key, val in d.items():
+            for key, val in list(d.items()):
                 if isinstance(val, dict):
                     if key == state:
                         for kk, vv in val.items():
@@ -271,7 +350,7 @@ class StyleData:
                 d.pop(k)
 
         # cache result
-        self.last_key = f"{widget_cls}-{variant}-{state}"
+        self.last_key = (widget_cls, variant, state)
         self._cache[self.last_key] = d
         return d
 
@@ -298,7 +377,7 @@ class StyleData:
         if states is None:
             states = ["base"]
 
-        cache_key = f"{widget_cls}-{variant}-{'|'.join(states)}"
+        cache_key = (widget_cls, variant, tuple(states))
         try:
             return self._cache[cache_key]
         except KeyError:
@@ -318,10 +397,62 @@ class StyleData:
 # ----------------------------------------------------------------------------
 
 
+# State flags that affect the push button style.
+_BUTTON_STATE_MASK = (
+    QStyle.StateFlag.State_Enabled
+    | QStyle.StateFlag.State_Sunken
+    | QStyle.StateFlag.State_MouseOver
+    | QStyle.StateFlag.State_On
+)
+
+
+def _button_state(state: QStyle.StateFlag) -> str:
+    """Map push button state flags to a style state name."""
+    if not (state & QStyle.StateFlag.State_Enabled):
+        return "disabled"
+    elif state & QStyle.StateFlag.State_Sunken:
+        return "pressed"
+    elif state & QStyle.StateFlag.State_MouseOver and not (
+        state & QStyle.StateFlag.State_On
+    ):
+        return "hover"
+    elif state & QStyle.StateFlag.State_On:
+        return "checked"
+    return "base"
+
+
 class ButtonDrawer:
     def __init__(self, style_inst: AYONStyle) -> None:
         self.style_inst = style_inst
         self.model = style_inst.model
+        # all combinations of the masked state flags -> style state name
+        self._state_names = {}
+        flags = [
+            QStyle.StateFlag.State_Enabled,
+            QStyle.StateFlag.State_Sunken,
+            QStyle.StateFlag.State_MouseOver,
+            QStyle.StateFlag.State_On,
+        ]
+        for i in range(1 << len(flags)):
+            state = QStyle.StateFlag.State_None
+            for bit, flag in enumerate(flags):
+                if i & (1 << bit):
+                    state |= flag
+            self._state_names[state] = _button_state(state)
+        # variant -> state name -> style
+        self._style_table = {
+            variant: {
+                wstate: self.model.get_style("QPushButton", variant, wstate)
+                for wstate in set(self._state_names.values())
+            }
+            for variant in self.model.widget_variants("QPushButton")
+        }
+        # variant -> content rect adjustments for icon-only and text
+        # buttons, read on every label paint.
+        self._content_adjust = {
+            variant: self._variant_content_adjust(variant)
+            for variant in self._style_table
+        }
 
     @property
     def base_class(self):
@@ -329,26 +460,17 @@ class ButtonDrawer:
 
     def register_drawers(self):
         return {
-            enum_to_str(
+            dispatch_key(
                 QStyle.ControlElement,
                 QStyle.ControlElement.CE_PushButton,
                 "QPushButton",
-            ): [
-                partial(
-                    self.style_inst.drawControl,
-                    QStyle.ControlElement.CE_PushButtonBevel,
-                ),
-                partial(
-                    self.style_inst.drawControl,
-                    QStyle.ControlElement.CE_PushButtonLabel,
-                ),
-            ],
-            enum_to_str(
+            ): (self.draw_push_button_bevel, self.draw_push_button_label),
+            dispatch_key(
                 QStyle.ControlElement,
                 QStyle.ControlElement.CE_PushButtonBevel,
                 "QPushButton",
             ): self.draw_push_button_bevel,
-            enum_to_str(
+            dispatch_key(
                 QStyle.ControlElement,
                 QStyle.ControlElement.CE_PushButtonLabel,
                 "QPushButton",
@@ -357,17 +479,17 @@ class ButtonDrawer:
 
     def register_sizers(self):
         return {
-            enum_to_str(
+            dispatch_key(
                 QStyle.ContentsType,
                 QStyle.ContentsType.CT_PushButton,
                 "QPushButton",
             ): self.calculate_push_button_size,
-            enum_to_str(
+            dispatch_key(
                 QStyle.SubElement,
                 QStyle.SubElement.SE_PushButtonContents,
                 "QPushButton",
             ): self.sub_element_rect,
-            enum_to_str(
+            dispatch_key(
                 QStyle.SubElement,
                 QStyle.SubElement.SE_PushButtonFocusRect,
                 "QPushButton",
@@ -376,27 +498,27 @@ class ButtonDrawer:
 
     def register_metrics(self):
         return {
-            enum_to_str(
+            dispatch_key(
                 QStyle.PixelMetric,
                 QStyle.PixelMetric.PM_ButtonMargin,
                 "QPushButton",
             ): self.get_metric,
-            enum_to_str(
+            dispatch_key(
                 QStyle.PixelMetric,
                 QStyle.PixelMetric.PM_DefaultFrameWidth,
                 "QPushButton",
             ): self.get_metric,
-            enum_to_str(
+            dispatch_key(
                 QStyle.PixelMetric,
                 QStyle.PixelMetric.PM_ButtonDefaultIndicator,
                 "QPushButton",
             ): self.get_metric,
-            enum_to_str(
+            dispatch_key(
                 QStyle.PixelMetric,
                 QStyle.PixelMetric.PM_FocusFrameVMargin,
                 "QPushButton",
             ): self.get_metric,
-            enum_to_str(
+            dispatch_key(
                 QStyle.PixelMetric,
                 QStyle.PixelMetric.PM_FocusFrameHMargin,
                 "QPushButton",
@@ -448,21 +570,17 @@ class ButtonDrawer:
     ) -> tuple[dict, str]:
         """Get the appropriate style dictionary for the widget's variant and
         state."""
-        variant = self.get_button_variant(widget)
+        return self._variant_style(self.get_button_variant(widget), state)
 
-        wstate = "base"
-        if not (state & QStyle.StateFlag.State_Enabled):
-            wstate = "disabled"
-        elif state & QStyle.StateFlag.State_Sunken:
-            wstate = "pressed"
-        elif state & QStyle.StateFlag.State_MouseOver and not (
-            state & QStyle.StateFlag.State_On
-        ):
-            wstate = "hover"
-        elif state & QStyle.StateFlag.State_On:
-            wstate = "checked"
-
-        style = self.model.get_style("QPushButton", variant, wstate)
+    def _variant_style(
+        self, variant: str, state: QStyle.StateFlag
+    ) -> tuple[dict, str]:
+        wstate = self._state_names[state & _BUTTON_STATE_MASK]
+        try:
+            style = self._style_table[variant][wstate]
+        except KeyError:
+            # unknown variant: let the model fall back to the default one.
+            style = self.model.get_style("QPushButton", variant, wstate)
 
         return style, wstate
 
@@ -476,43 +594,57 @@ class ButtonDrawer:
         if not isinstance(option, QStyleOptionButton) or widget is None:
             return
 
-        style, _ = self.get_button_style(widget, option.state)
+        variant = self.get_button_variant(widget)
+        style, _ = self._variant_style(variant, option.state)
         rect = option.rect
 
-        painter.save()
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-
-        # Draw button background with hover awareness
-        bg_color = style["background-color"]
-        painter.setOpacity(style.get("opacity", 1.0))
-
-        painter.setBrush(QBrush(bg_color))
-        painter.setPen(Qt.PenStyle.NoPen)
         border_radius = style.get("border-radius", 0)
-        if self.get_button_variant(widget) == "thumbnail":
+        # Opacity is only touched for styles that change it (disabled
+        # buttons).
+        prev_opacity = painter.opacity()
+        opacity = style.get("opacity", 1.0)
+        set_opacity = opacity != prev_opacity
+        if set_opacity:
+            painter.setOpacity(opacity)
+
+        bg_color = _qcolor(style["background-color"])
+        if variant == "thumbnail":
             # draw the icon clipped by the same rounded rect
             painter.save()
+            painter.setRenderHint(_RH_AA)
             clip_path = QPainterPath()
             clip_path.addRoundedRect(rect, border_radius, border_radius)
             painter.setClipPath(clip_path)
-            mode = QtGui.QIcon.Mode.Normal
+            mode = _ICON_NORMAL
+            painter.setPen(_NO_PEN)
             painter.setBrush(QColor("#000000"))
             painter.drawRoundedRect(rect, border_radius, border_radius)
             option.icon.paint(
                 painter,
                 rect,
-                Qt.AlignmentFlag.AlignCenter,
+                _ALIGN_CENTER,
                 mode,
             )
             painter.setClipping(False)
-            pen = QPen(QColor(style.get("border-color")))
+            pen = QPen(_qcolor(style.get("border-color")))
             pen.setWidth(int(style.get("border-width", 0)))
             painter.setPen(pen)
-            painter.setBrush(Qt.BrushStyle.NoBrush)
+            painter.setBrush(_NO_BRUSH)
             painter.drawRoundedRect(rect, border_radius, border_radius)
             painter.restore()
         else:
-            painter.drawRoundedRect(rect, border_radius, border_radius)
+            # the background is a pre-rendered pixmap: no pen, brush or
+            # antialiasing changes are needed to draw it.
+            painter.drawPixmap(
+                rect.topLeft(),
+                _rounded_rect_pixmap(
+                    rect.width(),
+                    rect.height(),
+                    border_radius,
+                    bg_color.rgba(),
+                    painter.device().devicePixelRatioF(),
+                ),
+            )
 
         # Draw focus outline if needed
         if (
@@ -522,16 +654,21 @@ class ButtonDrawer:
         ):
             focus_color = style["focus-outline-color"]
             pen = QPen(
-                QColor(focus_color), style.get("focus-outline-width", 0)
+                _qcolor(focus_color), style.get("focus-outline-width", 0)
             )
+            painter.save()
+            if border_radius:
+                painter.setRenderHint(_RH_AA)
             painter.setPen(pen)
-            painter.setBrush(Qt.BrushStyle.NoBrush)
+            painter.setBrush(_NO_BRUSH)
             focus_rect = rect.adjusted(1, 1, -1, -1)
             painter.drawRoundedRect(
                 focus_rect, border_radius + 1, border_radius + 1
             )
+            painter.restore()
 
-        painter.restore()
+        if set_opacity:
+            painter.setOpacity(prev_opacity)
 
     def draw_push_button_label(
         self,
@@ -547,22 +684,23 @@ class ButtonDrawer:
         variant = self.get_button_variant(widget)
 
         # Set up text color
-        text_color = QColor(style["color"])
+        text_color = _qcolor(style["color"])
         if not (option.state & QStyle.StateFlag.State_Enabled):  # type: ignore
             # Apply some opacity to disabled text
+            text_color = QColor(text_color)
             text_color.setAlpha(int(255 * 0.5))
 
         painter.save()
         painter.setPen(text_color)
 
         # Set up font
-        painter.setFont(_style_font(style, widget))
+        painter.setFont(_style_font(style, widget)[0])
 
         # Get content rectangle
         content_rect = self.style_inst.subElementRect(
             QStyle.SubElement.SE_PushButtonContents, option, widget
         )
-        # _debug_rect(painter, "#ff5555", content_rect)
+        # debug_rect(painter, "#ff5555", content_rect)
 
         # Draw icon if present
         if option.icon:  # type: ignore
@@ -580,21 +718,18 @@ class ButtonDrawer:
                 )
 
                 # Draw icon with text color inheritance
-                mode = QtGui.QIcon.Mode.Normal
+                mode = _ICON_NORMAL
                 if not (
                     option.state & QStyle.StateFlag.State_Enabled  # type: ignore
                 ):
-                    mode = QtGui.QIcon.Mode.Disabled
+                    mode = _ICON_DISABLED
                 elif option.state & QStyle.StateFlag.State_Sunken:  # type: ignore
-                    mode = QtGui.QIcon.Mode.Active
+                    mode = _ICON_ACTIVE
 
                 # option.icon = get_icon(widget._icon, color=icon_color)
 
-                option.icon.paint(  # type: ignore
-                    painter,
-                    icon_rect,
-                    Qt.AlignmentFlag.AlignCenter,
-                    mode,
+                _paint_icon(
+                    painter, option.icon, icon_rect, mode  # type: ignore
                 )
 
                 # Adjust text rectangle
@@ -605,18 +740,18 @@ class ButtonDrawer:
                 if option.text:  # type: ignore
                     painter.drawText(
                         text_rect,
-                        Qt.AlignmentFlag.AlignCenter,
+                        _ALIGN_CENTER,
                         option.text,  # type: ignore
                     )
             elif variant != "thumbnail":
                 # Icon only: center the icon
-                mode = QtGui.QIcon.Mode.Normal
+                mode = _ICON_NORMAL
                 if not (
                     option.state & QStyle.StateFlag.State_Enabled  # type: ignore
                 ):
-                    mode = QtGui.QIcon.Mode.Disabled
+                    mode = _ICON_DISABLED
                 elif option.state & QStyle.StateFlag.State_Sunken:  # type: ignore
-                    mode = QtGui.QIcon.Mode.Active
+                    mode = _ICON_ACTIVE
 
                 state = (
                     QtGui.QIcon.State.On
@@ -626,10 +761,10 @@ class ButtonDrawer:
 
                 # option.icon = get_icon(widget._icon, color=icon_color)
 
-                option.icon.paint(  # type: ignore
+                _paint_icon(
                     painter,
+                    option.icon,  # type: ignore
                     content_rect,
-                    Qt.AlignmentFlag.AlignCenter,
                     mode,
                     state,
                 )
@@ -638,7 +773,7 @@ class ButtonDrawer:
             if option.text and not style.get("ignore-text", False):  # type: ignore
                 painter.drawText(
                     content_rect,
-                    Qt.AlignmentFlag.AlignCenter,
+                    _ALIGN_CENTER,
                     option.text,  # type: ignore
                 )
 
@@ -669,18 +804,11 @@ class ButtonDrawer:
 
         # Set up font for text measurement
         style, _ = self.get_button_style(widget, option.state)  # type: ignore
-        font = _style_font(style, widget)
-
-        # Create font metrics for accurate text measurement
-        font_metrics = QtGui.QFontMetrics(font)
+        # Font used for text measurement
+        font_key = _style_font_key(style, widget)
 
         # Determine if button has icon
-        has_icon = (
-            self.get_button_has_icon(widget)
-            if widget
-            else not option.icon.isNull()  # type: ignore
-        )
-        has_icon = not option.icon.isNull()
+        has_icon = not option.icon.isNull()  # type: ignore
 
         # Determine appropriate padding
         if has_icon and not option.text:  # type: ignore
@@ -694,9 +822,9 @@ class ButtonDrawer:
         text_width = 0
         text_height = 0
         if option.text and not style.get("ignore-text", False):  # type: ignore
-            text_rect = font_metrics.boundingRect(option.text)  # type: ignore
-            text_width = text_rect.width()
-            text_height = text_rect.height()
+            text_width, text_height = _text_size(
+                *font_key, option.text  # type: ignore
+            )
 
         # Calculate icon dimensions
         icon_width = 0
@@ -723,13 +851,10 @@ class ButtonDrawer:
             content_width = text_width
             content_height = text_height
 
-        # Add padding (vertical, horizontal)
-        total_width = content_width + (
-            2 * padding[1]
-        )  # horizontal padding on both sides
-        total_height = content_height + (
-            2 * padding[0]
-        )  # vertical padding on top and bottom
+        # Add padding (vertical, horizontal) on both sides
+        pad_v, pad_h = padding
+        total_width = content_width + 2 * pad_h
+        total_height = content_height + 2 * pad_v
 
         # Ensure minimum button size (reasonable minimums)
         min_width = 16
@@ -740,6 +865,15 @@ class ButtonDrawer:
 
         return QtCore.QSize(total_width, total_height)
 
+    def _variant_content_adjust(self, variant: str) -> tuple[tuple, tuple]:
+        style = self.model.get_style("QPushButton", variant)
+        icon_v, icon_h = style["icon-padding"]
+        text_v, text_h = style["text-padding"]
+        return (
+            (icon_h, icon_v, -icon_h, -icon_v),
+            (text_h, text_v, -text_h, -text_v),
+        )
+
     def sub_element_rect(
         self,
         element: QStyle.SubElement,
@@ -747,21 +881,16 @@ class ButtonDrawer:
         widget: QWidget,
     ):
         if element == QStyle.SubElement.SE_PushButtonContents:
-            style = self.model.get_style(
-                "QPushButton", self.get_button_variant(widget)
-            )
-            if option.icon:
-                padding = (
-                    style["icon-padding"]
-                    if not widget.text()  # type: ignore
-                    else style["text-padding"]
+            variant = self.get_button_variant(widget)
+            try:
+                icon_adjust, text_adjust = self._content_adjust[variant]
+            except KeyError:
+                icon_adjust, text_adjust = self._variant_content_adjust(
+                    variant
                 )
-            else:
-                padding = style["text-padding"]
-
-            return option.rect.adjusted(  # type: ignore
-                padding[1], padding[0], -padding[1], -padding[0]
-            )
+            if option.icon and not widget.text():  # type: ignore
+                return option.rect.adjusted(*icon_adjust)  # type: ignore
+            return option.rect.adjusted(*text_adjust)  # type: ignore
 
         elif element == QStyle.SubElement.SE_PushButtonFocusRect:
             return option.rect.adjusted(-2, -2, 2, 2)  # type: ignore
@@ -776,6 +905,8 @@ class FrameDrawer:
     def __init__(self, style_inst: AYONStyle) -> None:
         self.style_inst = style_inst
         self.model = style_inst.model
+        # variant -> (pen, brush, radius)
+        self._frame_table: dict[str, tuple[QPen, QBrush, int]] = {}
 
     @property
     def base_class(self):
@@ -783,19 +914,31 @@ class FrameDrawer:
 
     def register_drawers(self):
         return {
-            enum_to_str(
+            dispatch_key(
                 QStyle.ControlElement,
                 QStyle.ControlElement.CE_ShapedFrame,
                 "QFrame",
             ): self.draw_frame,
         }
 
+    @staticmethod
+    def _frame_tools(style: dict) -> tuple[QPen, QBrush, int]:
+        """Build the pen, brush and radius used to paint a frame style."""
+        border_width = style.get("border-width", 0)
+        pen = QPen(_qcolor(style["border-color"]))
+        pen.setWidth(border_width)
+        pen.setStyle(
+            Qt.PenStyle.SolidLine if border_width else _NO_PEN
+        )
+        brush = QBrush(_qcolor(style["background-color"]))
+        return pen, brush, style.get("border-radius", 0)
+
     def draw_frame(self, option: QStyleOption, painter: QPainter, w: QWidget):
         # get style
         variant = getattr(w, "_variant_str", "")
-        style = self.model.get_style("QFrame", variant)
         # widget override for comment types
         if hasattr(w, "get_bg_color"):
+            style = self.model.get_style("QFrame", variant)
             bgc: QColor = w.get_bg_color(style["background-color"])
             style = dict(style)
             style["border-color"] = bgc
@@ -809,24 +952,20 @@ class FrameDrawer:
                 palette = viewport.palette()
                 palette.setColor(QPalette.ColorRole.Base, bgc)
                 viewport.setPalette(palette)
-
-        # pen setup
-        border_color = QColor(style["border-color"])
-        border_width = style.get("border-width", 0)
-        pen = QPen(border_color)
-        pen.setWidth(border_width)
-        pen.setStyle(
-            Qt.PenStyle.SolidLine if border_width else Qt.PenStyle.NoPen
-        )
-        # brush setup
-        bg_color = QColor(style["background-color"])
-        brush = QBrush(bg_color)
-        radius = style.get("border-radius", 0)
+            pen, brush, radius = self._frame_tools(style)
+        else:
+            # plain frames only depend on their variant
+            try:
+                pen, brush, radius = self._frame_table[variant]
+            except KeyError:
+                pen, brush, radius = self._frame_table[variant] = (
+                    self._frame_tools(self.model.get_style("QFrame", variant))
+                )
         # draw
         painter.setPen(pen)
         painter.setBrush(brush)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
         if radius:
+            painter.setRenderHint(_RH_AA, True)
             painter.drawRoundedRect(option.rect, radius, radius)
         else:
             painter.drawRect(option.rect)
@@ -846,17 +985,17 @@ class CheckboxDrawer:
 
     def register_drawers(self):
         return {
-            enum_to_str(
+            dispatch_key(
                 QStyle.PrimitiveElement,
                 QStyle.ControlElement.CE_CheckBox,
                 "QCheckBox",
             ): self.draw_control,
-            enum_to_str(
+            dispatch_key(
                 QStyle.PrimitiveElement,
                 QStyle.PrimitiveElement.PE_IndicatorCheckBox,
                 "QCheckBox",
             ): self.draw_toggle,
-            enum_to_str(
+            dispatch_key(
                 QStyle.PrimitiveElement,
                 QStyle.PrimitiveElement.PE_FrameFocusRect,
                 "QCheckBox",
@@ -865,17 +1004,17 @@ class CheckboxDrawer:
 
     def register_metrics(self):
         return {
-            enum_to_str(
+            dispatch_key(
                 QStyle.PixelMetric,
                 QStyle.PixelMetric.PM_IndicatorWidth,
                 "QCheckBox",
             ): self.get_metric,
-            enum_to_str(
+            dispatch_key(
                 QStyle.PixelMetric,
                 QStyle.PixelMetric.PM_IndicatorHeight,
                 "QCheckBox",
             ): self.get_metric,
-            enum_to_str(
+            dispatch_key(
                 QStyle.PixelMetric,
                 QStyle.PixelMetric.PM_CheckBoxLabelSpacing,
                 "QCheckBox",
@@ -912,14 +1051,17 @@ class CheckboxDrawer:
         painter: QPainter,
         w: QWidget | None = None,
     ):
-        painter.save()
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+        prev_pen = painter.pen()
+        prev_brush = painter.brush()
+        prev_aa = painter.testRenderHint(_RH_AA)
+        if not prev_aa:
+            painter.setRenderHint(_RH_AA, True)
         checked = bool(option.state & QStyle.StateFlag.State_On)
         style = self.model.get_style(
             "QCheckBox", "", state="checked" if checked else "base"
         )
-        painter.setBrush(QColor(style["background-color"]))
-        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(_qcolor(style["background-color"]))
+        painter.setPen(_NO_PEN)
 
         # draw toggle background
         frame_rect: QRectF = option.rect.toRectF().adjusted(1, 0, -1, 0)
@@ -927,7 +1069,7 @@ class CheckboxDrawer:
         painter.drawRoundedRect(frame_rect, radius, radius)
 
         # draw toggle
-        painter.setBrush(QColor(style["color"]))
+        painter.setBrush(_qcolor(style["color"]))
         offset = frame_rect.height() * 0.125
         state_rect: QRectF = frame_rect.adjusted(
             offset, offset, -offset, -offset
@@ -936,7 +1078,11 @@ class CheckboxDrawer:
         if checked:
             state_rect.moveRight(frame_rect.width() - offset * 0.5)
         painter.drawEllipse(state_rect)
-        painter.restore()
+
+        painter.setPen(prev_pen)
+        painter.setBrush(prev_brush)
+        if not prev_aa:
+            painter.setRenderHint(_RH_AA, False)
 
 
 # ----------------------------------------------------------------------------
@@ -1019,10 +1165,67 @@ class ComboBoxItemDelegate(QtWidgets.QStyledItemDelegate):
         return QtCore.QSize(total_width, total_height)
 
 
+# icon cacheKey -> largest side of the icon's first available size
+_ICON_MAX_SIZE_CACHE: dict[int, int] = {}
+
+
+def _icon_max_size(icon: QtGui.QIcon) -> int:
+    k = icon.cacheKey()
+    try:
+        return _ICON_MAX_SIZE_CACHE[k]
+    except KeyError:
+        size = icon.availableSizes()[0]
+        _ICON_MAX_SIZE_CACHE[k] = size = max(size.width(), size.height())
+        return size
+
+
+# number of colorized icons kept by _get_icon_cached()
+_ICON_CACHE_SIZE = 512
+
+
+@lru_cache(maxsize=_ICON_CACHE_SIZE)
+def _get_icon_cached(name: str, rgba: int) -> QtGui.QIcon:
+    """Return a colorized icon, keyed on the color's rgba value as QColor is
+    not hashable."""
+    return get_icon(name, color=QColor.fromRgba(rgba))
+
+
+def _reset_auto_icon_size(widget: QComboBox, _index: int) -> None:
+    widget._auto_icon_size = 0
+
+
+@lru_cache(maxsize=_ICON_CACHE_SIZE)
+def _get_icon_multimode(
+    name: str, rgba: int, size: int, dpr: float
+) -> QtGui.QIcon:
+    """Return a pixmap-backed icon with every mode pre-rendered at size.
+
+    Font icons rasterize their glyph each time Qt asks for a pixmap. Baking
+    the modes once lets Qt pick a ready pixmap when painting.
+    """
+    src = _get_icon_cached(name, rgba)
+    px_size = QSize(round(size * dpr), round(size * dpr))
+    icon = QtGui.QIcon()
+    for mode in (_ICON_NORMAL, _ICON_ACTIVE, _ICON_SELECTED, _ICON_DISABLED):
+        pm = src.pixmap(px_size, mode)
+        pm.setDevicePixelRatio(dpr)
+        icon.addPixmap(pm, mode)
+    return icon
+
+
 class ComboBoxDrawer:
     def __init__(self, style_inst: AYONStyle) -> None:
         self.style_inst = style_inst
         self.model = style_inst.model
+        # (font key, dpi, text) -> (width, height)
+        self._text_extents: dict[tuple[str, float, str], tuple[int, int]] = {}
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Re-read the paddings used by combobox_size() from the model."""
+        style = self.model.get_style("QComboBox")
+        self._tpx, self._tpy = style["text-padding"]
+        self._ipx, self._ipy = style["icon-padding"]
 
     @property
     def base_class(self):
@@ -1030,22 +1233,22 @@ class ComboBoxDrawer:
 
     def register_drawers(self):
         return {
-            # enum_to_str(
+            # dispatch_key(
             #     QStyle.ControlElement,
             #     QStyle.ControlElement.CE_ComboBoxLabel,
             #     "QComboBox",
             # ): self.draw_label,
-            enum_to_str(
+            dispatch_key(
                 QStyle.ComplexControl,
                 QStyle.ComplexControl.CC_ComboBox,
                 "QComboBox",
             ): self.draw_box,
-            enum_to_str(
+            dispatch_key(
                 QStyle.PrimitiveElement,
                 QStyle.PrimitiveElement.PE_PanelItemViewItem,
                 "QFrame",
             ): self.draw_panel_item_view_item,
-            enum_to_str(
+            dispatch_key(
                 QStyle.PrimitiveElement,
                 QStyle.PrimitiveElement.PE_FrameFocusRect,
                 "QFrame",
@@ -1054,7 +1257,7 @@ class ComboBoxDrawer:
 
     def register_sizers(self):
         return {
-            enum_to_str(
+            dispatch_key(
                 QStyle.ContentsType,
                 QStyle.ContentsType.CT_ComboBox,
                 "QComboBox",
@@ -1076,7 +1279,6 @@ class ComboBoxDrawer:
         )
         _radius = _style.get("border-radius", 0)
 
-        # print(f"SUB_CTL: {opt.activeSubControls}")
         if not w.isEditable():
             bg_color = opt.palette.color(
                 QPalette.ColorGroup.Active, QPalette.ColorRole.Base
@@ -1086,7 +1288,6 @@ class ComboBoxDrawer:
             )
 
             if not w:
-                # print("NO WIDGET")
                 return
 
             inverted = False
@@ -1100,22 +1301,27 @@ class ComboBoxDrawer:
                 )
                 if item:
                     inverted = getattr(w, "_inverted", False)
-                    fg_color = bg_color if inverted else QColor(item.color)
-                    bg_color = QColor(item.color) if inverted else bg_color
+                    item_color = item.qcolor()
+                    fg_color = bg_color if inverted else item_color
+                    bg_color = item_color if inverted else bg_color
                     icon_name = item.icon
 
             # Paint background with status color
-            rect = opt.rect
-            p.save()
-            p.setBrush(QBrush(bg_color))
-            p.setPen(QtCore.Qt.PenStyle.NoPen)
-            p.drawRoundedRect(rect, _radius, _radius)
-            p.restore()
-
-            # set pen for text drawing
+            # Only brush and pen change, so restore those instead of pushing
+            # the whole painter state. The pen is left set for text drawing.
+            prev_brush = p.brush()
+            p.setBrush(_solid_brush(bg_color.rgba()))
+            p.setPen(_NO_PEN)
+            p.drawRoundedRect(opt.rect, _radius, _radius)
+            p.setBrush(prev_brush)
             p.setPen(fg_color)
             if icon_name:
-                opt.currentIcon = get_icon(icon_name, color=fg_color)
+                opt.currentIcon = _get_icon_multimode(
+                    icon_name,
+                    fg_color.rgba(),
+                    w.iconSize().width(),
+                    w.devicePixelRatioF(),
+                )
         else:
             # editable combobox - IMPLEMENT ME
             pass
@@ -1124,7 +1330,7 @@ class ComboBoxDrawer:
         self, option: QStyleOption, painter: QPainter, w: QWidget
     ):
         stl = self.model.get_style("QComboBox")
-        option.backgroundBrush.setColor(QColor(stl["menu-background-color"]))
+        option.backgroundBrush.setColor(_qcolor(stl["menu-background-color"]))
         super(AYONStyle, self.style_inst).drawPrimitive(  # type: ignore
             QStyle.PrimitiveElement.PE_PanelItemViewItem, option, painter, w
         )
@@ -1137,39 +1343,48 @@ class ComboBoxDrawer:
         widget: QWidget | None,
     ) -> QtCore.QSize:
         if not option or not isinstance(option, QStyleOptionComboBox):
-            return QSize()
-
-        style = self.model.get_style("QComboBox")
+            return _EMPTY_SIZE
 
         text_width = cb_height = 0
         if isinstance(widget, QComboBox):
+            fm = option.fontMetrics
+            font_key = widget.font().key()
+            dpi = fm.fontDpi()
             for i in range(widget.count()):
-                t_rect = option.fontMetrics.boundingRect(
-                    widget.itemData(i, Qt.ItemDataRole.DisplayRole)
-                )
-                text_width = max(text_width, t_rect.width())
-                cb_height = max(cb_height, t_rect.height())
+                text = widget.itemData(i, Qt.ItemDataRole.DisplayRole)
+                key = (font_key, dpi, text)
+                try:
+                    t_width, t_height = self._text_extents[key]
+                except KeyError:
+                    t_rect = fm.boundingRect(text)
+                    t_width, t_height = t_rect.width(), t_rect.height()
+                    self._text_extents[key] = (t_width, t_height)
+                text_width = max(text_width, t_width)
+                cb_height = max(cb_height, t_height)
 
-        text_width += style["text-padding"][0] * 2
-        cb_height += style["text-padding"][1] * 2
+        text_width += self._tpx * 2
+        cb_height += self._tpy * 2
 
         icon_width = 0
         if option.currentIcon:
-            icon_size = getattr(widget, "_icon_size", 0)
+            icon_size = getattr(widget, "_icon_size", 0) or getattr(
+                widget, "_auto_icon_size", 0
+            )
             if icon_size == 0:
-                all_sizes = option.currentIcon.availableSizes()
-                icon_size = max(all_sizes[0].width(), all_sizes[0].height())
-            icon_width = icon_size + style["icon-padding"][0] * 2
-            icon_height = icon_size + style["icon-padding"][1] * 2
+                icon_size = _icon_max_size(option.currentIcon)
+                if widget is not None:
+                    # reset by polish() when the current item changes.
+                    widget._auto_icon_size = icon_size
+            icon_width = icon_size + self._ipx * 2
+            icon_height = icon_size + self._ipy * 2
             cb_height = max(cb_height, icon_height)
             if text_width:
-                icon_width += style["text-padding"][0]
+                icon_width += self._tpx
 
-        final_size = QSize(
+        return QSize(
             text_width + icon_width,
             min(getattr(widget, "_height", cb_height), cb_height),
         )
-        return final_size
 
 
 # ----------------------------------------------------------------------------
@@ -1188,17 +1403,17 @@ class ScrollBarDrawer:
 
     def register_drawers(self):
         return {
-            enum_to_str(
+            dispatch_key(
                 QStyle.ControlElement,
                 QStyle.ControlElement.CE_ScrollBarSlider,
                 "QScrollBar",
             ): self.draw_scrollbar_slider,
-            enum_to_str(
+            dispatch_key(
                 QStyle.ControlElement,
                 QStyle.ControlElement.CE_ScrollBarAddPage,
                 "QScrollBar",
             ): self.draw_scrollbar_page,
-            enum_to_str(
+            dispatch_key(
                 QStyle.ControlElement,
                 QStyle.ControlElement.CE_ScrollBarSubPage,
                 "QScrollBar",
@@ -1207,7 +1422,7 @@ class ScrollBarDrawer:
 
     def register_sizers(self):
         return {
-            enum_to_str(
+            dispatch_key(
                 QStyle.ComplexControl,
                 QStyle.ComplexControl.CC_ScrollBar,
                 "QScrollBar",
@@ -1216,12 +1431,12 @@ class ScrollBarDrawer:
 
     def register_metrics(self):
         return {
-            enum_to_str(
+            dispatch_key(
                 QStyle.PixelMetric,
                 QStyle.PixelMetric.PM_ScrollBarExtent,
                 "QScrollBar",
             ): self.get_metric,
-            enum_to_str(
+            dispatch_key(
                 QStyle.PixelMetric,
                 QStyle.PixelMetric.PM_ScrollBarSliderMin,
                 "QScrollBar",
@@ -1313,11 +1528,11 @@ class ScrollBarDrawer:
         """Draw the scrollbar slider/thumb."""
         style = self.model.get_style("QScrollBar")
         painter.save()
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(_RH_AA)
 
         # Draw slider background
-        painter.setBrush(QBrush(QColor(style.get("slider-color"))))
-        pen = QPen(QColor(style.get("background-color")))
+        painter.setBrush(_qcolor(style.get("slider-color")))
+        pen = QPen(_qcolor(style.get("background-color")))
         pen.setWidth(style.get("border-width"))
         painter.setPen(pen)
         radius = style.get("border-radius")
@@ -1334,11 +1549,11 @@ class ScrollBarDrawer:
         """Draw scrollbar page buttons."""
         style = self.model.get_style("QScrollBar")
         painter.save()
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(_RH_AA)
 
         # Draw slider background
-        painter.setBrush(QBrush(QColor(style.get("background-color"))))
-        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(_qcolor(style.get("background-color")))
+        painter.setPen(_NO_PEN)
         painter.drawRect(option.rect)
 
         painter.restore()
@@ -1358,7 +1573,7 @@ class LabelDrawer:
 
     def register_drawers(self):
         return {
-            enum_to_str(
+            dispatch_key(
                 QStyle.ControlElement,
                 QStyle.ControlElement.CE_ShapedFrame,
                 "QLabel",
@@ -1380,19 +1595,19 @@ class TooltipDrawer:
 
     def register_drawers(self):
         return {
-            enum_to_str(
+            dispatch_key(
                 QStyle.ControlElement,
                 QStyle.ControlElement.CE_ShapedFrame,
                 "QToolTip",
             ): self.draw_control,
-            enum_to_str(
+            dispatch_key(
                 QStyle.PrimitiveElement,
                 QStyle.PrimitiveElement.PE_PanelTipLabel,
                 "QToolTip",
             ): partial(
                 self.draw_primitive, QStyle.PrimitiveElement.PE_PanelTipLabel
             ),
-            enum_to_str(
+            dispatch_key(
                 QStyle.PrimitiveElement,
                 QStyle.PrimitiveElement.PE_Frame,
                 "QToolTip",
@@ -1401,12 +1616,12 @@ class TooltipDrawer:
 
     def register_sizers(self):
         return {
-            enum_to_str(
+            dispatch_key(
                 QStyle.SubElement,
                 QStyle.SubElement.SE_ShapedFrameContents,
                 "QToolTip",
             ): self.get_rect,
-            enum_to_str(
+            dispatch_key(
                 QStyle.SubElement,
                 QStyle.SubElement.SE_FrameLayoutItem,
                 "QToolTip",
@@ -1434,11 +1649,11 @@ class TooltipDrawer:
     ) -> None:
         if prim == QStyle.PrimitiveElement.PE_Frame:
             painter.save()
-            painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+            painter.setRenderHint(_RH_AA, True)
             style = self.model.get_style("QToolTip")
-            pen = QPen(style["border-color"])
+            pen = QPen(_qcolor(style["border-color"]))
             pen.setWidth(style["border-width"])
-            painter.setBrush(Qt.BrushStyle.NoBrush)
+            painter.setBrush(_NO_BRUSH)
             painter.setPen(pen)
             radius = int(style["border-radius"])
             painter.drawRoundedRect(
@@ -1450,11 +1665,11 @@ class TooltipDrawer:
 
         elif prim == QStyle.PrimitiveElement.PE_PanelTipLabel:
             painter.save()
-            painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+            painter.setRenderHint(_RH_AA, True)
             style = self.model.get_style("QToolTip")
-            brush = QBrush(style["background-color"])
+            brush = QBrush(_qcolor(style["background-color"]))
             painter.setBrush(brush)
-            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setPen(_NO_PEN)
             radius = int(style["border-radius"])
             painter.drawRoundedRect(
                 option.rect,
@@ -1509,7 +1724,7 @@ class ItemViewItemDrawer:
 
     def register_drawers(self):
         return {
-            enum_to_str(
+            dispatch_key(
                 QStyle.ControlElement,
                 QStyle.ControlElement.CE_ItemViewItem,
                 "QStyledItemDelegate",
@@ -1569,7 +1784,7 @@ class ItemViewItemDrawer:
         - Checkbox background and text color come from checked state
         """
         painter.save()
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(_RH_AA)
 
         # For QStyleOptionViewItem, we need to check different properties
         if not isinstance(option, QStyleOptionViewItem):
@@ -1600,42 +1815,42 @@ class ItemViewItemDrawer:
 
         # Background: use hover style if hovered, regardless of checked state
         if is_hovered:
-            bg_color = QColor(
+            bg_color = _qcolor(
                 hover_style.get(
                     "background-color",
                     base_style.get("background-color", "transparent"),
                 )
             )
         else:
-            bg_color = QColor(
+            bg_color = _qcolor(
                 base_style.get("background-color", "transparent")
             )
 
         # Text color: use checked style if checked, else base
         if is_checked:
-            text_color = QColor(
+            text_color = _qcolor(
                 checked_style.get("color", base_style.get("color", "#8b9198"))
             )
         else:
-            text_color = QColor(base_style.get("color", "#8b9198"))
+            text_color = _qcolor(base_style.get("color", "#8b9198"))
 
         # Checkbox background: use checked style if checked, else base
         if is_checked:
-            checkbox_bg_color = QColor(
+            checkbox_bg_color = _qcolor(
                 checked_style.get(
                     "checkbox-background-color",
                     base_style.get("checkbox-background-color", "#424a57"),
                 )
             )
         else:
-            checkbox_bg_color = QColor(
+            checkbox_bg_color = _qcolor(
                 base_style.get("checkbox-background-color", "#424a57")
             )
 
         # Draw background if hovered (transparent check not needed for hover)
         if is_hovered:
             painter.setBrush(QBrush(bg_color))
-            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setPen(_NO_PEN)
             painter.drawRect(option.rect)
 
         # Calculate checkbox rect - positioned on right side
@@ -1648,7 +1863,7 @@ class ItemViewItemDrawer:
 
         # Draw checkbox background
         painter.setBrush(QBrush(checkbox_bg_color))
-        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setPen(_NO_PEN)
         painter.drawRoundedRect(cb_rect, border_radius, border_radius)
 
         # Draw X mark if checked
@@ -1686,6 +1901,32 @@ class AYONStyle(QCommonStyle):
     Supports widget variants: surface, tonal, filled, tertiary, text, nav, etc.
     """
 
+    # style hint -> value, stored as plain ints.
+    _STYLE_HINTS = {
+        QStyle.StyleHint.SH_Button_FocusPolicy: (
+            Qt.FocusPolicy.StrongFocus.value
+        ),
+        QStyle.StyleHint.SH_RequestSoftwareInputPanel: 0,
+        QStyle.StyleHint.SH_ComboBox_PopupFrameStyle: (
+            QFrame.Shape.NoFrame.value
+        ),
+    }
+
+    # Drawer classes in registration order. LabelDrawer comes before
+    # FrameDrawer because QLabel inherits from QFrame.
+    _DRAWER_CLASSES = (
+        TooltipDrawer,
+        LabelDrawer,
+        ButtonDrawer,
+        CheckboxDrawer,
+        ComboBoxDrawer,
+        ScrollBarDrawer,
+        FrameDrawer,
+        ItemViewItemDrawer,
+    )
+    # Shared by all instances, built by the first one.
+    _base_classes: dict | None = None
+
     def __init__(self) -> None:
         super().__init__()
         self.model = StyleData()
@@ -1693,25 +1934,39 @@ class AYONStyle(QCommonStyle):
         self.drawers = {}
         self.sizers = {}
         self.metrics = {}
-        self.base_classes = {}
-        self.drawer_objs = [
-            TooltipDrawer(self),
-            LabelDrawer(self),  # first because QLabel inherits from QFrame.
-            ButtonDrawer(self),
-            CheckboxDrawer(self),
-            ComboBoxDrawer(self),
-            ScrollBarDrawer(self),
-            FrameDrawer(self),
-            ItemViewItemDrawer(self),
-        ]
+        # drawers are bound to this instance's style data, so the callable
+        # tables stay per instance.
+        self.drawer_objs = [cls(self) for cls in self._DRAWER_CLASSES]
         for obj in self.drawer_objs:
-            self.base_classes.update(obj.base_class)
             if hasattr(obj, "register_drawers"):
                 self.drawers.update(obj.register_drawers())
             if hasattr(obj, "register_sizers"):
                 self.sizers.update(obj.register_sizers())
             if hasattr(obj, "register_metrics"):
                 self.metrics.update(obj.register_metrics())
+        # control elements can register several drawers: store them all as
+        # tuples so drawControl has a single code path.
+        for key, calls in self.drawers.items():
+            if key[0] is QStyle.ControlElement:
+                self.drawers[key] = (
+                    tuple(calls)
+                    if isinstance(calls, (list, tuple))
+                    else (calls,)
+                )
+
+        # Registered metrics only depend on the metric and the style data, so
+        # resolve them once; pixelMetric() is among the most frequent calls.
+        self._metric_values = {
+            key: func(QStyle.PixelMetric(key[1]), None, None)
+            for key, func in self.metrics.items()
+        }
+
+        if AYONStyle._base_classes is None:
+            base_classes = {}
+            for obj in self.drawer_objs:
+                base_classes.update(obj.base_class)
+            AYONStyle._base_classes = base_classes
+        self.base_classes = AYONStyle._base_classes
 
     def widget_key(self, w: QWidget | None) -> str:
         if self._in_widget_key or w is None or not isValid(w):
@@ -1736,37 +1991,70 @@ class AYONStyle(QCommonStyle):
                         return "QStyledItemDelegate"
                 finally:
                     self._in_widget_key = False
-            for name, wtype in self.base_classes.items():
-                if issubclass(type(w), wtype):
-                    if w.objectName() == "qtooltip_label":
+            try:
+                name = w._ayon_widget_key
+            except AttributeError:
+                name = self._base_class_key(w)
+            if name:
+                if w.objectName() == "qtooltip_label":
+                    return "QToolTip"
+                if isinstance(w, QLabel):
+                    p = w.parent()
+                    # NOTE: Qt does not use QToolTip but a QLabel (a private
+                    # QLabelTip class) !!
+                    # if the parent is a widget and it doesn't have a
+                    # layout, it could be a tooltip.
+                    # Sometimes, objectName() == "qtooltip_label" but the
+                    # object name is set when the rect requests are made.
+                    if p and isinstance(p, QWidget) and not p.layout():
                         return "QToolTip"
-                    if isinstance(w, QLabel):
-                        p = w.parent()
-                        # NOTE: Qt does not use QToolTip but a QLabel (a private
-                        # QLabelTip class) !!
-                        # if the parent is a widget and it doesn't have a
-                        # layout, it could be a tooltip.
-                        # Sometimes, objectName() == "qtooltip_label" but the
-                        # object name is set when the rect requests are made.
-                        if p and isinstance(p, QWidget) and not p.layout():
-                            return "QToolTip"
-                    return name
+            return name
         return ""
 
+    def _base_class_key(self, w: QWidget) -> str:
+        """Find the registered base class name of a widget and store it on
+        the instance so later lookups skip the scan."""
+        name = ""
+        for cls_name, wtype in self.base_classes.items():
+            if issubclass(type(w), wtype):
+                name = cls_name
+                break
+        w._ayon_widget_key = name
+        return name
+
     def polish(self, widget) -> None:
         """Polish widgets to enable hover tracking and custom palette."""
         if isinstance(widget, QWidget):
             super().polish(widget)
+            # Qt polishes again on reparenting or style changes; the setup
+            # below only needs to run once per widget.
+            if getattr(widget, "_ayon_polished", False):
+                return
             # TODO(plp): move to QStyle:polishPalette(QPalette)
-            widget.setPalette(self.model.base_palette)
-
-            # Enable mouse tracking for buttons to receive hover events
+            # Widgets inheriting the application palette set below already
+            # match; setting it again would detach a copy per widget.
+            if widget.palette() != self.model.base_palette:
+                widget.setPalette(self.model.base_palette)
+            self._base_class_key(widget)
+
+            # WA_Hover is enough for hover styling. Mouse tracking also
+            # sends every button-less move event, so keep it to widgets that
+            # track the hovered item or handle.
             widget.setAttribute(Qt.WidgetAttribute.WA_Hover, True)
-            widget.setMouseTracking(True)
+            if isinstance(widget, (QAbstractItemView, QAbstractSlider)):
+                widget.setMouseTracking(True)
 
             if isinstance(widget, QComboBox):
                 widget.setMinimumContentsLength(1)
-                widget.setItemDelegate(ComboBoxItemDelegate(parent=widget))
+                if not isinstance(widget.itemDelegate(), ComboBoxItemDelegate):
+                    widget.setItemDelegate(
+                        ComboBoxItemDelegate(parent=widget)
+                    )
+                # the icon size guessed in combobox_size() follows the
+                # current item.
+                widget.currentIndexChanged.connect(
+                    partial(_reset_auto_icon_size, widget)
+                )
                 widget.setSizeAdjustPolicy(
                     QComboBox.SizeAdjustPolicy.AdjustToContents
                 )
@@ -1775,15 +2063,24 @@ class AYONStyle(QCommonStyle):
                 widget.setAttribute(
                     Qt.WidgetAttribute.WA_TranslucentBackground, True
                 )
+            widget._ayon_polished = True
 
         elif isinstance(widget, QPalette):
-            print("YES: QPalette")
+            log.debug("polish: QPalette")
 
         elif isinstance(widget, QApplication):
             super().polish(widget)
+            widget.setPalette(self.model.base_palette)
         else:
             super().polish(widget)
 
+    def unpolish(self, widget) -> None:
+        """Forget the polish flag so a later polish() sets the widget up
+        again."""
+        if isinstance(widget, QWidget):
+            widget._ayon_polished = False
+        super().unpolish(widget)
+
     def drawControl(
         self,
         element: QStyle.ControlElement,
@@ -1792,24 +2089,25 @@ class AYONStyle(QCommonStyle):
         w: QWidget | None = None,
     ) -> None:
         """Draw control elements (buttons, labels, etc.)."""
-        key = enum_to_str(QStyle.ControlElement, element, self.widget_key(w))
+        if w is None:
+            # every drawer is registered for a widget class.
+            super().drawControl(element, option, painter, w)
+            return
+
+        draw_ce_calls = self.drawers.get(
+            (QStyle.ControlElement, element, self.widget_key(w)), _MISS
+        )
 
         if type(w).__name__ in W_T:
-            log.info("  >>  drawControl %s %s", type(w), key)
+            log.info("  >>  drawControl %s %s", type(w), element)
 
-        try:
-            draw_ce_calls = self.drawers[key]
-        except KeyError:
+        if draw_ce_calls is _MISS:
             # no custom drawer fallback
             super().drawControl(element, option, painter, w)
             return
-        else:
-            if isinstance(draw_ce_calls, list):
-                for draw_ce in draw_ce_calls:
-                    draw_ce(option, painter, w)
-            elif callable(draw_ce_calls):
-                draw_ce_calls(option, painter, w)
-            return
+
+        for draw_ce in draw_ce_calls:
+            draw_ce(option, painter, w)
 
     def drawComplexControl(
         self,
@@ -1818,13 +2116,17 @@ class AYONStyle(QCommonStyle):
         p: QPainter,
         w: QWidget | None = None,
     ) -> None:
-        key = enum_to_str(QStyle.ComplexControl, cc, self.widget_key(w))
+        if w is None:
+            # every drawer is registered for a widget class.
+            return super().drawComplexControl(cc, opt, p, w)
+
+        draw_cc = self.drawers.get(
+            (QStyle.ComplexControl, cc, self.widget_key(w)), _MISS
+        )
         if type(w).__name__ in W_T:
-            log.info("  >>  drawComplexControl %s %s", type(w), key)
+            log.info("  >>  drawComplexControl %s %s", type(w), cc)
 
-        try:
-            draw_cc = self.drawers[key]
-        except KeyError:
+        if draw_cc is _MISS:
             # no custom drawer fallback
             return super().drawComplexControl(cc, opt, p, w)
 
@@ -1838,16 +2140,19 @@ class AYONStyle(QCommonStyle):
         w: QWidget | None = None,
     ) -> None:
         """Draw primitive elements."""
+        if w is None:
+            # every drawer is registered for a widget class.
+            super().drawPrimitive(element, option, painter, w)
+            return
 
-        key = enum_to_str(QStyle.PrimitiveElement, element, self.widget_key(w))
+        draw_prim = self.drawers.get(
+            (QStyle.PrimitiveElement, element, self.widget_key(w)), _MISS
+        )
         if type(w).__name__ in W_T:
-            log.info("  >>  drawPrimitive %s %s", type(w), key)
+            log.info("  >>  drawPrimitive %s %s", type(w), element)
 
-        try:
-            draw_prim = self.drawers[key]
-        except KeyError:
+        if draw_prim is _MISS:
             # Fall back to parent implementation
-            # print(f"no match for {k}")
             super().drawPrimitive(element, option, painter, w)
             return
 
@@ -1860,14 +2165,14 @@ class AYONStyle(QCommonStyle):
         widget: QWidget | None = None,
     ) -> QRect:
         """Calculate rectangles for sub-elements."""
-        key = enum_to_str(QStyle.SubElement, element, self.widget_key(widget))
+        sizer = self.sizers.get(
+            (QStyle.SubElement, element, self.widget_key(widget)), _MISS
+        )
 
         if isinstance(widget, QLabel):
-            log.debug("%s %s", type(widget).__name__, key)
+            log.debug("%s %s", type(widget).__name__, element)
 
-        try:
-            sizer = self.sizers[key]
-        except KeyError:
+        if sizer is _MISS:
             # Fall back to parent implementation
             # Catch RuntimeError in case widget's C++ object was already deleted
             try:
@@ -1888,14 +2193,14 @@ class AYONStyle(QCommonStyle):
         sc: QStyle.SubControl,
         w: QWidget | None = None,
     ) -> QRect:
-        key = enum_to_str(QStyle.ComplexControl, cc, self.widget_key(w))
+        sizer = self.sizers.get(
+            (QStyle.ComplexControl, cc, self.widget_key(w)), _MISS
+        )
 
         if isinstance(w, QLabel):
-            log.debug("%s %s", type(w).__name__, key)
+            log.debug("%s %s", type(w).__name__, cc)
 
-        try:
-            sizer = self.sizers[key]
-        except KeyError:
+        if sizer is _MISS:
             # Fall back to parent implementation
             return super().subControlRect(cc, opt, sc, w)
 
@@ -1911,19 +2216,18 @@ class AYONStyle(QCommonStyle):
         widget: QWidget | None = None,
     ) -> int:
         """Return pixel measurements for various style metrics."""
-        # print(f"PM: {metric}")
-        key = enum_to_str(QStyle.PixelMetric, metric, self.widget_key(widget))
+        value = self._metric_values.get(
+            (QStyle.PixelMetric, metric, self.widget_key(widget)), _MISS
+        )
 
         if isinstance(widget, QLabel):
-            log.debug("%s %s", type(widget), key)
+            log.debug("%s %s", type(widget), metric)
 
-        try:
-            metric_func = self.metrics[key]
-        except KeyError:
+        if value is _MISS:
             # Fall back to parent implementation
             return super().pixelMetric(metric, opt, widget)
 
-        return metric_func(metric, opt, widget)
+        return value
 
     def styleHint(
         self,
@@ -1933,13 +2237,9 @@ class AYONStyle(QCommonStyle):
         shret: QtWidgets.QStyleHintReturn | None = None,
     ) -> int:
         """Return style hints for behavior configuration."""
-
-        if hint == QStyle.StyleHint.SH_Button_FocusPolicy:
-            return Qt.FocusPolicy.StrongFocus
-        elif hint == QStyle.StyleHint.SH_RequestSoftwareInputPanel:
-            return 0
-        elif hint == QStyle.StyleHint.SH_ComboBox_PopupFrameStyle:
-            return QFrame.Shape.NoFrame
+        value = self._STYLE_HINTS.get(hint, _MISS)
+        if value is not _MISS:
+            return value
 
         # Fall back to parent implementation
         return super().styleHint(hint, opt, w, shret)
@@ -1952,214 +2252,21 @@ class AYONStyle(QCommonStyle):
         widget: QWidget | None = None,
     ) -> QtCore.QSize:
         """Calculate minimum size requirements for widgets based on their content."""
-        # print(f"CT: {contents_type}")
-        key = enum_to_str(
-            QStyle.ContentsType, contents_type, self.widget_key(widget)
+        sizer = self.sizers.get(
+            (QStyle.ContentsType, contents_type, self.widget_key(widget)),
+            _MISS,
         )
 
         if isinstance(widget, QLabel):
             log.debug("%s", widget)
 
-        try:
-            sizer = self.sizers[key]
-        except KeyError:
+        if sizer is _MISS:
             if option:
                 return super().sizeFromContents(
                     contents_type, option, contents_size, widget
                 )
             else:
                 # Create a default size if no option is provided
-                return QtCore.QSize(100, 32)  # reasonable default
-        else:
-            return sizer(contents_type, option, contents_size, widget)
-
-
-# TEST ========================================================================
-
-
-if __name__ == "__main__":
-    import time
-
-    from .components.buttons import AYButton
-    from .components.check_box import AYCheckBox
-    from .components.combo_box import ALL_STATUSES, AYComboBox
-    from .components.container import AYContainer
-    from .components.label import AYLabel
-    from .components.layouts import AYHBoxLayout, AYVBoxLayout
-    from .components.text_box import AYTextBox
-    from .components.user_image import AYUserImage
-    from .tester import Style, test
-    from .variants import QPushButtonVariants
-
-    def time_it(func):
-        i = time.time()
-        r = func()
-        e = (time.time() - i) * 1000
-        return r, e
-
-    m, e = time_it(StyleData)
-    print(f"  init time: {e:.6f} ms")
-
-    print("> button-surface-base: -------------------------------------------")
-    d, e = time_it(lambda: m.get_style("QPushButton", "surface", "base"))
-    # print(json.dumps(d, indent=4))
-    print(f"  style time: {e:.6f} ms")
-
-    print("> button-surface-hover -------------------------------------------")
-    d, e = time_it(lambda: m.get_style("QPushButton", "surface", "hover"))
-    # print(json.dumps(d, indent=4))
-    print(f"  style time: {e:.6f} ms")
-
-    d, e = time_it(lambda: m.get_style("QPushButton", "surface", "hover"))
-    print(f"  cached style time: {e:.6f} ms")
-
-    m.dump_cache_stats()
-
-    print("> enum_to_str benchmarking --------------------------------------")
-    ee = 0
-    i = 0
-    s = ""
-    vals = _enum_values(QStyle.ControlElement)
-    for i, v in enumerate(vals):
-        s, e = time_it(lambda: enum_to_str(QStyle.ControlElement, v, ""))
-        ee += e
-    ee /= i
-    print(f"  enum_to_str = {s!r}: {ee:.6f} ms ({i} lookups)")
-    s = ""
-    ee = 0
-    runs = 1000
-    for i in range(runs):
-        for i, v in enumerate(vals):
-            s, e = time_it(
-                lambda: enum_to_str(
-                    QStyle.ControlElement,
-                    QStyle.ControlElement.CE_PushButtonBevel,
-                    "",
-                )
-            )
-            ee += e
-    total_runs = runs * len(vals)
-    ee /= total_runs
-    print(f"  cached enum_to_str = {s!r}: {ee:.6f} ms ({total_runs} runs)")
-
-    # all_enums(QStyle)
-
-    print("> ui test --------------------------------------------------------")
-
-    def _ui_test():
-        # Create and show the test widget
-        widget = AYContainer(
-            layout=AYContainer.Layout.VBox,
-            variant=AYContainer.Variants.Default,
-            margin=0,
-            layout_spacing=10,
-            layout_margin=10,
-        )
-
-        container_1 = AYContainer(
-            widget,
-            layout=AYContainer.Layout.VBox,
-            variant=AYContainer.Variants.Low,
-            margin=0,
-            layout_margin=10,
-            layout_spacing=10,
-        )
-        widget.add_widget(container_1)
-
-        variants = [v for v in QPushButtonVariants]
-
-        # text buttons
-        l1 = AYHBoxLayout(margin=0)
-        for i, var in enumerate(variants):
-            b = AYButton(
-                f"{var.value} button",
-                variant=var,
-                tooltip=f"using variant {var.value}...",
-            )
-            l1.addWidget(b)
-        container_1.add_layout(l1)
-
-        # text + icon buttons
-        l2 = AYHBoxLayout(margin=0)
-        for i, var in enumerate(variants):
-            b = AYButton(f"{var.value} button", variant=var, icon="add")
-            l2.addWidget(b)
-        container_1.add_layout(l2)
-
-        container_2 = AYContainer(
-            layout=AYContainer.Layout.HBox,
-            variant=AYContainer.Variants.Low,
-            margin=0,
-            layout_margin=10,
-            layout_spacing=10,
-        )
-        # icon buttons
-        for i, var in enumerate(variants):
-            b = AYButton(
-                variant=var, icon="add", name_id="ICON_ONLY" if i == 0 else ""
-            )
-            container_2.add_widget(b)
-        container_2.addStretch()
-        widget.add_widget(container_2)
-
-        container_3 = AYContainer(
-            layout=AYContainer.Layout.HBox,
-            variant=AYContainer.Variants.Low,
-            margin=0,
-            layout_margin=10,
-            layout_spacing=10,
-        )
-        te = AYTextBox()
-        te.set_markdown(
-            "## Title\nText can be **bold** or *italic*, as expected !\n"
-            "- [ ] Do this\n- [ ] Do that\n"
-        )
-        container_3.add_widget(te)
-        vblyt = AYVBoxLayout(spacing=8)
-        cbb = AYComboBox(items=ALL_STATUSES)
-        vblyt.addWidget(cbb)
-        cbbi = AYComboBox(items=ALL_STATUSES, inverted=True)
-        vblyt.addWidget(cbbi)
-        cb = AYCheckBox("CheckBox")
-        cb.setToolTip(("A typical switch..."))
-        vblyt.addWidget(cb)
-        vblyt.addWidget(AYLabel("Normal label", tool_tip="text only"))
-        vblyt.addWidget(
-            AYLabel("Dimmed label", dim=True, tool_tip="text dimmed")
-        )
-        vblyt.addWidget(
-            AYLabel(
-                "Icon + text label", icon="favorite", tool_tip="Icon and text"
-            )
-        )
-        vblyt.addWidget(
-            AYLabel(
-                icon="token",
-                icon_color="#ff8800",
-                icon_size=32,
-                tool_tip="32 px orange icon only",
-            )
-        )
-        vblyt.addWidget(
-            AYLabel(
-                "a badge",
-                icon_color="#0088ff",
-                variant=AYLabel.Variants.Badge,
-                tool_tip="a blue badge",
-            )
-        )
-        usr_ly = AYHBoxLayout(spacing=8)
-        usr_ly.addWidget(
-            AYUserImage(
-                src=Path(__file__).parent.joinpath("resources", "avatar1.jpg")
-            )
-        )
-        vblyt.addStretch()
-        container_3.add_layout(vblyt)
-        container_3.addStretch()
-
-        widget.add_widget(container_3)
-
-        return widget
+                return _DEFAULT_CONTENT_SIZE  # reasonable default
 
-    test(_ui_test, style=Style.AyonStyleOverCSS)
+        return sizer(contents_type, option, contents_size, widget)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import os
+from functools import lru_cache
 
 from qtpy import QtCore, QtGui, QtWidgets
 
@@ -14,6 +14,18 @@ except ImportError:
     from ..vendor.qtmaterialsymbols import get_icon
 
 
+@lru_cache(maxsize=512)
+def _button_icon(name: str, off_rgba: int, on_rgba: int) -> QtGui.QIcon:
+    """Return a shared two-state icon, keyed on rgba values as QColor is not
+    hashable."""
+    return get_icon(
+        icon_name_off=name,
+        color_off=QtGui.QColor.fromRgba(off_rgba),
+        icon_name_on=name,
+        color_on=QtGui.QColor.fromRgba(on_rgba),
+    )
+
+
 class AYButton(QtWidgets.QPushButton):
     Variants = QPushButtonVariants
 
@@ -32,7 +44,9 @@ class AYButton(QtWidgets.QPushButton):
     ):
         super().__init__(*args, **kwargs)
         self.setStyle(get_ayon_style())
-        self.setCheckable(checkable)
+        if checkable:
+            # buttons are not checkable by default
+            self.setCheckable(True)
 
         # Convert enum to string if needed
         style_dict = get_ayon_style_data("QPushButton", variant.value)
@@ -114,19 +128,21 @@ class AYButton(QtWidgets.QPushButton):
         #   State.Off: checkable off
         #   State.On: checkable on
         #   State.Active: hover
-        icn = get_icon(
-            icon_name_off=self._icon,
-            color_off=self._icon_color,
-            icon_name_on=self._icon,
-            color_on=self._icon_hover_color,
+        icn = _button_icon(
+            self._icon,
+            self._icon_color.rgba(),
+            self._icon_hover_color.rgba(),
         )
-        self.setIcon(icn)
+        if self.icon().cacheKey() != icn.cacheKey():
+            self.setIcon(icn)
 
 
 # TEST =======================================================================
 
 
 if __name__ == "__main__":
+    import os
+
     from ..tester import Style, test
     from .container import AYContainer
 
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 import logging
-import os
-from dataclasses import dataclass
-from typing import List, Literal, Optional, get_args, overload
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import List, Literal, Optional, Sequence, overload
 
 try:
     from qtmaterialsymbols import get_icon  # type: ignore
@@ -13,9 +13,11 @@ from qtpy import QtCore, QtWidgets
 from qtpy.QtGui import (
     QBrush,
     QColor,
+    QIcon,
     QPainter,
     QPaintEvent,
     QPalette,
+    QStandardItem,
     QStandardItemModel,
 )
 
@@ -25,6 +27,7 @@ logger = logging.getLogger(__name__)
 
 # Size variants
 Size = Literal["full", "short", "icon"]
+SIZES: tuple[str, ...] = ("full", "short", "icon")
 
 ALL_STATUSES = [
     {
@@ -72,28 +75,78 @@ ALL_STATUSES = [
 ]
 
 
-@dataclass
+@dataclass(frozen=True)
 class Item:
     text: str
     short_text: Optional[str] = None
     icon: Optional[str] = None
     color: Optional[str] = None
+    _qcolor: Optional[QColor] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _brush: Optional[QBrush] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
+    def qcolor(self) -> QColor:
+        """Return the item color as a QColor, built on first use."""
+        if self._qcolor is None:
+            # derived cache, fine to fill on a frozen instance.
+            object.__setattr__(self, "_qcolor", QColor(self.color))
+        return self._qcolor
 
-def txt_color(bg_color: str | QColor) -> QColor:
-    value = (
-        QColor(bg_color).valueF()
+    def brush(self) -> QBrush:
+        """Return a solid brush of the item color, built on first use."""
+        if self._brush is None:
+            object.__setattr__(self, "_brush", QBrush(self.qcolor()))
+        return self._brush
+
+
+# Items are immutable, so combo boxes using the default statuses share them.
+STATUS_ITEMS: tuple[Item, ...] = tuple(Item(**s) for s in ALL_STATUSES)
+
+
+def _to_items(items: Sequence[dict | Item]) -> list[Item]:
+    if items is ALL_STATUSES:
+        return list(STATUS_ITEMS)
+    return [s if isinstance(s, Item) else Item(**s) for s in items]
+
+
+@lru_cache(maxsize=512)
+def _item_icon(name: Optional[str], color: Optional[str]) -> QIcon:
+    """Return a shared status icon for a name and color."""
+    return get_icon(name, color_normal=color, color_selected=color)
+
+
+_TXT_LIGHT = QColor("#eee")
+_TXT_DARK = QColor("#222")
+
+
+@lru_cache(maxsize=256)
+def _is_light(bg_color: str | int) -> bool:
+    color = (
+        QColor(bg_color)
         if isinstance(bg_color, str)
-        else bg_color.valueF()
+        else QColor.fromRgba(bg_color)
     )
-    return QColor("#eee") if value < 0.9 else QColor("#222")
+    return color.valueF() >= 0.9
+
+
+def txt_color(bg_color: str | QColor) -> QColor:
+    """Return a readable text color for bg_color. The returned color is
+    shared and must not be modified."""
+    key = bg_color if isinstance(bg_color, str) else bg_color.rgba()
+    return _TXT_DARK if _is_light(key) else _TXT_LIGHT
 
 
 class AYComboBox(QtWidgets.QComboBox):
+    # set once the widget is initialized, see changeEvent.
+    _bg_brush: Optional[QBrush] = None
+
     def __init__(
         self,
         parent: Optional[QtWidgets.QWidget] = None,
-        items: List[dict] | None = None,
+        items: Sequence[dict | Item] | None = None,
         size: Size = "full",
         height: int = 30,
         placeholder: Optional[str] = None,
@@ -115,9 +168,10 @@ class AYComboBox(QtWidgets.QComboBox):
         self._placeholder: Optional[str] = placeholder
         self._inverted: bool = inverted
         self._disabled: bool = disabled
-        self._item_list: list = [Item(**s) for s in items] if items else []
+        self._item_list: list = _to_items(items) if items else []
         self._icon_size: int = icon_size
         self._custom_options: List[Item] = []
+        self._bg_brush = self._window_brush()
 
         self.update_items()
 
@@ -134,55 +188,113 @@ class AYComboBox(QtWidgets.QComboBox):
         self._item_list.append(it)
         self.update_items()
 
-    def update_items(self, item_list: list[dict] | None = None):
-        if item_list:
-            self.setModel(QStandardItemModel())
-            self._item_list = [Item(**s) for s in item_list]
-
-        bg_color = self.palette().color(
-            QPalette.ColorGroup.Active, QPalette.ColorRole.Window
+    def _window_brush(self) -> QBrush:
+        return QBrush(
+            self.palette().color(
+                QPalette.ColorGroup.Active, QPalette.ColorRole.Window
+            )
         )
 
-        for idx, item in enumerate(self._item_list):
-            icon = get_icon(
-                item.icon,
-                color_normal=item.color,
-                color_selected=item.color,
-            )
+    def changeEvent(self, e: QtCore.QEvent) -> None:
+        super().changeEvent(e)
+        if self._bg_brush is None or e.type() not in (
+            QtCore.QEvent.Type.PaletteChange,
+            QtCore.QEvent.Type.StyleChange,
+        ):
+            return
+        # the item background follows the palette: only refresh the items
+        # when its window color actually changed.
+        bg_brush = self._window_brush()
+        if bg_brush.color() != self._bg_brush.color():
+            self._bg_brush = bg_brush
+            self.update_items()
 
-            text = str(
-                item.text
-                if self._size == "full"
-                else item.short_text
-                if self._size == "short"
-                else ""
+    def update_items(self, item_list: Sequence[dict | Item] | None = None):
+        bg_brush = self._bg_brush
+
+        if item_list:
+            # fill the replacement model before handing it to the combo box,
+            # so views only see one model reset.
+            self._item_list = _to_items(item_list)
+            model = QStandardItemModel()
+            model.invisibleRootItem().appendRows(
+                [self._make_row(item, bg_brush) for item in self._item_list]
             )
+            self.setModel(model)
+            return
 
-            if idx >= self.count():
-                self.addItem(icon, text)
-                self.setItemData(idx, item, QtCore.Qt.ItemDataRole.UserRole)
-            else:
+        count = self.count()
+        for idx, item in enumerate(self._item_list[:count]):
+            icon = _item_icon(item.icon, item.color)
+            text = self._item_text(item)
+            # every write emits dataChanged: skip unchanged values.
+            if self.itemIcon(idx).cacheKey() != icon.cacheKey():
                 self.setItemIcon(idx, icon)
+            if self.itemText(idx) != text:
                 self.setItemText(idx, text)
+            for value, role in (
+                (item.brush(), QtCore.Qt.ItemDataRole.ForegroundRole),
+                (bg_brush, QtCore.Qt.ItemDataRole.BackgroundRole),
+            ):
+                if self.itemData(idx, role) != value:
+                    self.setItemData(idx, value, role)
+
+        new_items = self._item_list[count:]
+        if not new_items:
+            return
+        model = self.model()
+        if not isinstance(model, QStandardItemModel):
+            for idx, item in enumerate(new_items, count):
+                self.addItem(
+                    _item_icon(item.icon, item.color),
+                    self._item_text(item),
+                    item,
+                )
+                self.setItemData(
+                    idx, item.brush(), QtCore.Qt.ItemDataRole.ForegroundRole
+                )
+                self.setItemData(
+                    idx, bg_brush, QtCore.Qt.ItemDataRole.BackgroundRole
+                )
+            return
+        # fill the new rows before inserting them all at once, so the view
+        # gets a single rowsInserted instead of one per row and role.
+        model.invisibleRootItem().appendRows(
+            [self._make_row(item, bg_brush) for item in new_items]
+        )
 
-            self.setItemData(
-                idx,
-                QBrush(item.color),
-                QtCore.Qt.ItemDataRole.ForegroundRole,
-            )
-            self.setItemData(
-                idx,
-                QBrush(bg_color),
-                QtCore.Qt.ItemDataRole.BackgroundRole,
-            )
+    def _make_row(self, item: Item, bg_brush: QBrush) -> QStandardItem:
+        row = QStandardItem(
+            _item_icon(item.icon, item.color), self._item_text(item)
+        )
+        row.setData(item, QtCore.Qt.ItemDataRole.UserRole)
+        row.setForeground(item.brush())
+        row.setBackground(bg_brush)
+        return row
+
+    def _item_text(self, item: Item) -> str:
+        return str(
+            item.text
+            if self._size == "full"
+            else item.short_text
+            if self._size == "short"
+            else ""
+        )
+
+    def _apply_size(self):
+        """Only update the item texts: icons and colors do not depend on the
+        size."""
+        for idx, item in enumerate(self._item_list):
+            self.setItemText(idx, self._item_text(item))
 
     def set_inverted(self, state: bool):
+        # the style reads _inverted when painting.
         self._inverted = state
-        self.update_items()
+        self.update()
 
     def set_size(self, size: Size):
         self._size = size
-        self.update_items()
+        self._apply_size()
 
     def sizeHint(self) -> QtCore.QSize:
         if self.testAttribute(QtCore.Qt.WidgetAttribute.WA_StyleSheet):
@@ -253,7 +365,7 @@ if __name__ == "__main__":
             cb, stretch=0, alignment=QtCore.Qt.AlignmentFlag.AlignLeft
         )
         size = AYComboBox(w)
-        size.addItems([s for s in get_args(Size)])
+        size.addItems(SIZES)
         w.add_widget(size)
 
         # configure
@@ -1,17 +1,34 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 
-from qtpy.QtCore import QEvent, QPoint, Qt, Signal
+from qtpy.QtCore import (
+    QEvent,
+    QObject,
+    QPoint,
+    QRunnable,
+    Qt,
+    QThreadPool,
+    QTimer,
+    Signal,
+)
 from qtpy.QtGui import (
     QColor,
     QEnterEvent,
+    QFont,
+    QFontMetrics,
+    QImage,
+    QImageReader,
     QPainter,
     QPaintEvent,
     QPixmap,
+    QPixmapCache,
+    QShowEvent,
     QTextDocument,
 )
 from qtpy.QtWidgets import (
+    QApplication,
     QDialog,
     QLabel,
     QMessageBox,
@@ -47,6 +64,14 @@ from .user_image import AYUserImage
 
 # STATUS ---------------------------------------------------------------------
 
+# shared by all status changes using the default statuses.
+_DEFAULT_STATUS_INDEX = {
+    kw["text"]: StatusUiModel(**kw) for kw in ALL_STATUSES
+}
+_UNKNOWN_STATUS = StatusUiModel(
+    "Unknown Status", "UKN", "shield_question", "#d05050"
+)
+
 
 class AYStatusChange(AYFrame):
     def __init__(
@@ -57,10 +82,11 @@ class AYStatusChange(AYFrame):
         **kwargs,
     ):
         self._data = data or StatusChangeModel()
-        self.statuses = {
-            kw["text"]: StatusUiModel(**kw)
-            for kw in status_definitions or ALL_STATUSES
-        }
+        self.statuses = (
+            {kw["text"]: StatusUiModel(**kw) for kw in status_definitions}
+            if status_definitions
+            else _DEFAULT_STATUS_INDEX
+        )
         super().__init__(
             *args, variant=AYFrame.Variants.Low, margin=0, **kwargs
         )
@@ -68,12 +94,10 @@ class AYStatusChange(AYFrame):
 
     @property
     def unknown_status(self):
-        return StatusUiModel(
-            "Unknown Status", "UKN", "shield_question", "#d05050"
-        )
+        return _UNKNOWN_STATUS
 
     def status_icon(self, status):
-        model = self.statuses.get(status, self.unknown_status)
+        model = self.statuses.get(status, _UNKNOWN_STATUS)
         return model.icon, model.color
 
     def _build_top_bar(self):
@@ -106,22 +130,20 @@ class AYStatusChange(AYFrame):
             rel_text_size=-2,
         )
         self.date = AYLabel(self._data.short_date, dim=True, rel_text_size=-2)
-        cntr = AYContainer(
-            layout=AYContainer.Layout.HBox,
-            variant=AYContainer.Variants.Low,
-            layout_spacing=0,
-        )
-        cntr.add_widget(self.str_1, stretch=0)
-        cntr.add_widget(self.status_0, stretch=0)
-        cntr.add_widget(self.str_2, stretch=0)
-        cntr.add_widget(self.status_1, stretch=0)
-        cntr.addStretch()
-        cntr.add_widget(self.date, stretch=0)
-        return cntr
+        # a plain layout: a container would only repaint the frame's
+        # background for every row of the feed.
+        lyt = AYHBoxLayout(margin=0, spacing=0)
+        lyt.addWidget(self.str_1, stretch=0)
+        lyt.addWidget(self.status_0, stretch=0)
+        lyt.addWidget(self.str_2, stretch=0)
+        lyt.addWidget(self.status_1, stretch=0)
+        lyt.addStretch()
+        lyt.addWidget(self.date, stretch=0)
+        return lyt
 
     def _build(self):
         lyt = AYVBoxLayout(self, margin=0, spacing=0)
-        lyt.addWidget(self._build_top_bar(), stretch=0)
+        lyt.addLayout(self._build_top_bar(), stretch=0)
 
 
 # PUBLISH ---------------------------------------------------------------------
@@ -151,22 +173,18 @@ class AYPublish(AYFrame):
         self.static = AYLabel(
             "published a version", dim=True, rel_text_size=-2
         )
-        cntr = AYContainer(
-            layout=AYContainer.Layout.HBox,
-            variant=AYContainer.Variants.Low,
-            layout_spacing=8,
-        )
-        cntr.setContentsMargins(0, 0, 0, 4)
-        cntr.add_widget(self.user_icon, stretch=0)
-        cntr.add_widget(self.user_name, stretch=0)
-        cntr.add_widget(self.static, stretch=0)
-        cntr.addStretch()
-        cntr.add_widget(self.date, stretch=0)
-        return cntr
+        lyt = AYHBoxLayout(margin=0, spacing=8)
+        lyt.setContentsMargins(0, 0, 0, 4)
+        lyt.addWidget(self.user_icon, stretch=0)
+        lyt.addWidget(self.user_name, stretch=0)
+        lyt.addWidget(self.static, stretch=0)
+        lyt.addStretch()
+        lyt.addWidget(self.date, stretch=0)
+        return lyt
 
     def _build(self):
         lyt = AYVBoxLayout(self, margin=0, spacing=0)
-        lyt.addWidget(self._build_top_bar(), stretch=0)
+        lyt.addLayout(self._build_top_bar(), stretch=0)
         self.text_field = AYCommentField(
             text=f"{self._data.product}\n\n{self._data.version}",
             num_lines=3,
@@ -210,10 +228,22 @@ class AYCommentField(AYTextEdit):
         self._user_list: list[User] = user_list or []
         self._data = model
         self._bg_color = None
+        self._last_md: str | None = None
+        # (document revision, markdown) of the last serialization.
+        self._serialized: tuple[int, str] = (-1, "")
+        self._editor_ready = False
 
         super().__init__(*args, variant=variant, **kwargs)
-        self.setAutoFormatting(QTextEdit.AutoFormattingFlag.AutoAll)
         self.setSizeAdjustPolicy(QTextEdit.SizeAdjustPolicy.AdjustToContents)
+
+        # Format mentions when the text changes. Edits are coalesced: typing
+        # only reformats once it pauses, see set_markdown for the initial
+        # text.
+        self._format_timer = QTimer(self)
+        self._format_timer.setSingleShot(True)
+        self._format_timer.setInterval(120)
+        self._format_timer.timeout.connect(self._format_mentions)
+        self.document().contentsChanged.connect(self._format_timer.start)
         self.set_markdown(text)
 
         # configure
@@ -227,6 +257,16 @@ class AYCommentField(AYTextEdit):
             )
         self.setReadOnly(self._read_only)
 
+    def setReadOnly(self, ro: bool) -> None:
+        super().setReadOnly(ro)
+        if not ro and not self._editor_ready:
+            self._setup_editor()
+
+    def _setup_editor(self) -> None:
+        """Set up editing helpers, on first use as most comment fields are
+        never edited."""
+        self._editor_ready = True
+        self.setAutoFormatting(QTextEdit.AutoFormattingFlag.AutoAll)
         # Setup user completer
         setup_user_completer(
             self,
@@ -234,11 +274,6 @@ class AYCommentField(AYTextEdit):
             self._on_text_changed,
         )
 
-        # Connect text changed signal to format mentions
-        self.document().contentsChanged.connect(
-            lambda: format_comment_on_change(self)
-        )
-
     def get_bg_color(self, base_color: str):
         if not self._bg_color:
             self._bg_color = base_color
@@ -258,6 +293,10 @@ class AYCommentField(AYTextEdit):
         Args:
             md: Markdown text to display
         """
+        # parsing is costly: skip it if the document still holds this text.
+        if md == self._last_md and not self.document().isModified():
+            return
+
         # Check if text contains web markdown syntax
         has_web_markdown = any(
             pattern in md for pattern in ["\n----", "**", "_", "[", "`"]
@@ -266,9 +305,19 @@ class AYCommentField(AYTextEdit):
         if has_web_markdown:
             # Use web markdown formatting (removes syntax, applies formatting)
             self.set_web_markdown(md)
+            # formatting mentions would reset the formats applied above.
+            self._format_timer.stop()
         else:
             # Use standard markdown
             self.document().setMarkdown(md, MD_DIALECT)
+            # format right away rather than showing raw mentions for a moment.
+            if self._format_timer.isActive():
+                self._format_timer.stop()
+                self._format_mentions()
+
+        # user edits set the modified flag again.
+        self._last_md = md
+        self.document().setModified(False)
 
     def set_web_markdown(self, md: str, styles: dict | None = None) -> None:
         """Set markdown from web data with formatting.
@@ -283,7 +332,17 @@ class AYCommentField(AYTextEdit):
         self.setReadOnly(self._read_only)
 
     def as_markdown(self) -> str:
-        return self.document().toMarkdown(MD_DIALECT)
+        # any content or format change bumps the document revision.
+        revision = self.document().revision()
+        if self._serialized[0] != revision:
+            self._serialized = (
+                revision,
+                self.document().toMarkdown(MD_DIALECT),
+            )
+        return self._serialized[1]
+
+    def _format_mentions(self) -> None:
+        format_comment_on_change(self)
 
     def _on_text_changed(self) -> None:
         """Handle text changes to show/hide completer."""
@@ -337,6 +396,106 @@ class AYCommentField(AYTextEdit):
         super().mouseMoveEvent(event)
 
 
+class _ThumbnailSignals(QObject):
+    # cache key, scaled image (null if the file could not be loaded)
+    finished = Signal(str, QImage)
+
+
+class _ThumbnailLoader(QRunnable):
+    """Decode and scale an image in a pool thread.
+
+    QPixmap can only be used in the GUI thread, so the loader works on a
+    QImage and the receiver converts it.
+    """
+
+    def __init__(self, key: str, path: str, w: int, h: int):
+        super().__init__()
+        self.signals = _ThumbnailSignals()
+        self._key = key
+        self._path = path
+        self._size = (w, h)
+
+    def run(self):
+        image = QImage(self._path)
+        if not image.isNull():
+            image = image.scaled(
+                *self._size,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation,
+            )
+        self.signals.finished.emit(self._key, image)
+
+
+# Attachment pixmaps are kept in QPixmapCache, which evicts them within its
+# memory budget. Make room for a few full size previews next to the
+# thumbnails, without lowering a limit set by the application.
+_PIXMAP_CACHE_LIMIT_KB = 64 * 1024
+if QPixmapCache.cacheLimit() < _PIXMAP_CACHE_LIMIT_KB:
+    QPixmapCache.setCacheLimit(_PIXMAP_CACHE_LIMIT_KB)
+
+
+def _full_size_pixmap(path: str, mtime_ns: int, w: int, h: int) -> QPixmap:
+    """Return the image at path, only scaled down if it doesn't fit in
+    w x h. Returns a null pixmap if the image can not be loaded."""
+    key = f"ayon-full:{path}:{mtime_ns}:{w}x{h}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is not None:
+        return pixmap
+
+    reader = QImageReader(path)
+    size = reader.size()
+    if size.width() > w or size.height() > h:
+        # let the decoder produce the target size rather than decoding the
+        # whole image and scaling it afterwards.
+        reader.setScaledSize(
+            size.scaled(w, h, Qt.AspectRatioMode.KeepAspectRatio)
+        )
+    pixmap = QPixmap.fromImageReader(reader)
+    if not pixmap.isNull():
+        QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+def _mtime_ns(path: str) -> int | None:
+    """Return the modification time of path or None if it doesn't exist."""
+    if not path:
+        return None
+    try:
+        return Path(path).stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+@lru_cache(maxsize=None)
+def _message_box(
+    icon: QMessageBox.Icon, buttons: QMessageBox.StandardButton
+) -> QMessageBox:
+    return QMessageBox(icon, "", "", buttons)
+
+
+def _exec_message_box(
+    parent: QWidget,
+    text: str,
+    title: str = "",
+    icon: QMessageBox.Icon = QMessageBox.Icon.NoIcon,
+    buttons: QMessageBox.StandardButton = QMessageBox.StandardButton.Ok,
+) -> int:
+    """Show a modal message box over parent and return the clicked button.
+
+    One box is shared per icon and buttons combination rather than building
+    a new dialog each time.
+    """
+    box = _message_box(icon, buttons)
+    box.setWindowTitle(title)
+    box.setText(text)
+    box.setParent(parent, Qt.WindowType.Dialog)
+    try:
+        return box.exec()
+    finally:
+        # the parent would delete the shared box with itself.
+        box.setParent(None)
+
+
 class AYImageAttachment(QLabel):
     """Widget to display an image attachment with thumbnail and full-size preview."""
 
@@ -364,30 +523,49 @@ class AYImageAttachment(QLabel):
         self.setToolTip("Click to view full size")
 
         self._hovered = False
+        self._thumb_signals: _ThumbnailSignals | None = None
 
         # Load and display thumbnail
         self._load_thumbnail()
 
     def _load_thumbnail(self):
-        """Load and display the thumbnail image."""
-        if not self._thumb_path or not Path(self._thumb_path).exists():
+        """Display the thumbnail image, loading it in a pool thread if it is
+        not cached yet."""
+        mtime_ns = _mtime_ns(self._thumb_path)
+        if mtime_ns is None:
             self.setText("Image not available")
             return
 
-        pixmap = QPixmap(self._thumb_path)
-        if pixmap.isNull():
-            self.setText("Failed to load image")
-            return
-
-        # Scale pixmap to fit within max dimensions while maintaining aspect ratio
-        scaled_pixmap = pixmap.scaled(
-            self._max_width,
-            self._max_height,
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation,
+        # the modification time is part of the key, so edited files reload.
+        key = (
+            f"ayon-thumb:{self._thumb_path}:{mtime_ns}:"
+            f"{self._max_width}x{self._max_height}"
         )
+        pixmap = QPixmapCache.find(key)
+        if pixmap is not None:
+            self.setPixmap(pixmap)
+            return
 
-        self.setPixmap(scaled_pixmap)
+        self.setText("Loading...")
+        # Scale image to fit within max dimensions while maintaining aspect
+        # ratio
+        loader = _ThumbnailLoader(
+            key, self._thumb_path, self._max_width, self._max_height
+        )
+        # keep the signals alive until the queued result is delivered. The
+        # connection is dropped if this widget is deleted first.
+        self._thumb_signals = loader.signals
+        loader.signals.finished.connect(self._on_thumbnail_loaded)
+        QThreadPool.globalInstance().start(loader)
+
+    def _on_thumbnail_loaded(self, key: str, image: QImage):
+        self._thumb_signals = None
+        if image.isNull():
+            self.setText("Failed to load image")
+            return
+        pixmap = QPixmap.fromImage(image)
+        QPixmapCache.insert(key, pixmap)
+        self.setPixmap(pixmap)
 
     def enterEvent(self, event):
         """Dim the image slightly when mouse enters."""
@@ -422,22 +600,13 @@ class AYImageAttachment(QLabel):
 
     def _show_full_size(self):
         """Show full-size image in a dialog that respects aspect ratio."""
-        if not self._image_path or not Path(self._image_path).exists():
-            QMessageBox.warning(
+        mtime_ns = _mtime_ns(self._image_path)
+        if mtime_ns is None:
+            _exec_message_box(
                 self,
-                "Image Not Available",
                 "The full-size image is not available.",
-            )
-            return
-
-        # Load the full-size image
-        original_pixmap = QPixmap(self._image_path)
-
-        if original_pixmap.isNull():
-            QMessageBox.warning(
-                self,
-                "Image Load Error",
-                "Failed to load the full-size image.",
+                title="Image Not Available",
+                icon=QMessageBox.Icon.Warning,
             )
             return
 
@@ -446,15 +615,19 @@ class AYImageAttachment(QLabel):
         max_w = int(screen_size.width() * 0.8)
         max_h = int(screen_size.height() * 0.8)
 
-        # Scale if too large for screen while maintaining aspect ratio
-        display_pixmap = original_pixmap
-        if original_pixmap.width() > max_w or original_pixmap.height() > max_h:
-            display_pixmap = original_pixmap.scaled(
-                max_w,
-                max_h,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation,
+        # Load the full-size image, scaled if too large for the screen
+        display_pixmap = _full_size_pixmap(
+            self._image_path, mtime_ns, max_w, max_h
+        )
+
+        if display_pixmap.isNull():
+            _exec_message_box(
+                self,
+                "Failed to load the full-size image.",
+                title="Image Load Error",
+                icon=QMessageBox.Icon.Warning,
             )
+            return
 
         dialog = QDialog(self)
         dialog.setWindowTitle("Image Preview")
@@ -495,6 +668,10 @@ class AYComment(AYContainer):
         self._data = data if data else CommentModel()
         self._user_list: list[User] = user_list or []
         self._bg_color = None
+        self._attachments_built = False
+        # hover and edit buttons are only built when first needed.
+        self._edit_buttons_built = False
+        self._save_buttons_built = False
 
         super().__init__(
             *args,
@@ -509,12 +686,8 @@ class AYComment(AYContainer):
 
         self._build()
 
-        # configure
-        if self._data:
-            self.text_field.set_markdown(self._data.comment)
-            self.date.setText(self._data.short_date)
-            self.set_comment_category()
-            self._build_image_attachments()
+        # configure: the text field and date are already filled by _build.
+        self.set_comment_category()
 
     def _build_top_bar(self):
         self.user_icon = AYUserImage(
@@ -527,18 +700,13 @@ class AYComment(AYContainer):
         )
         self.user_name = AYLabel(self._data.user_full_name, bold=True)
         self.date = AYLabel(self._data.short_date, dim=True, rel_text_size=-2)
-        cntr = AYContainer(
-            layout=AYContainer.Layout.HBox,
-            variant=AYContainer.Variants.Low,
-            margin=0,
-            layout_spacing=8,
-        )
-        cntr.setContentsMargins(0, 0, 0, 4)
-        cntr.add_widget(self.user_icon)
-        cntr.add_widget(self.user_name)
-        cntr.addStretch()
-        cntr.add_widget(self.date)
-        return cntr
+        lyt = AYHBoxLayout(margin=0, spacing=8)
+        lyt.setContentsMargins(0, 0, 0, 4)
+        lyt.addWidget(self.user_icon)
+        lyt.addWidget(self.user_name)
+        lyt.addStretch()
+        lyt.addWidget(self.date)
+        return lyt
 
     def _build_editor_toolbar(self):
         lyt = AYHBoxLayout()
@@ -549,24 +717,27 @@ class AYComment(AYContainer):
             tooltip="Not Implemented Yet !",
             parent=self,
         )
+        lyt.addWidget(self.reaction)
+        lyt.addStretch(10)
+        self._editor_toolbar = lyt
+        return lyt
+
+    def _build_save_buttons(self):
+        self._save_buttons_built = True
         self.cancel_edit = AYButton(
             "Cancel", variant=AYButton.Variants.Nav, parent=self
         )
         self.save_edit = AYButton(
             "Save", variant=AYButton.Variants.Filled, parent=self
         )
-        lyt.addWidget(self.reaction)
-        lyt.addStretch(10)
-        lyt.addWidget(self.cancel_edit)
-        lyt.addWidget(self.save_edit)
+        self._editor_toolbar.addWidget(self.cancel_edit)
+        self._editor_toolbar.addWidget(self.save_edit)
 
         self.cancel_edit.clicked.connect(self._cancel_edit)
-        self.cancel_edit.setVisible(False)
         self.save_edit.clicked.connect(self._save_edit)
-        self.save_edit.setVisible(False)
-        return lyt
 
     def _build_edit_buttons(self):
+        self._edit_buttons_built = True
         self.edit_frame = AYContainer(
             layout=AYContainer.Layout.HBox,
             bg_tint=self._data.category_color,
@@ -585,14 +756,13 @@ class AYComment(AYContainer):
         self.edit_button.setFixedSize(bsize, bsize)
         self.edit_frame.add_widget(self.del_button)
         self.edit_frame.add_widget(self.edit_button)
-        self.top_line.addStretch(100)
         self.top_line.add_widget(self.edit_frame)
         self.edit_frame.setVisible(False)
         self.del_button.clicked.connect(self._confirm_delete)
         self.edit_button.clicked.connect(self._edit_comment)
 
     def _build(self):
-        self.add_widget(self._build_top_bar())
+        self.add_layout(self._build_top_bar())
         self.text_field = AYCommentField(
             self,
             text=self._data.comment,
@@ -628,64 +798,43 @@ class AYComment(AYContainer):
 
         editor_lyt.add_layout(self._build_editor_toolbar(), stretch=0)
         self.add_widget(editor_lyt)
-        self._build_edit_buttons()
+        # the edit buttons go after this stretch, see _show_edit_buttons.
+        self.top_line.addStretch(100)
 
     def _build_image_attachments(self):
         """Build and display image attachments as separate clickable widgets."""
-        if (
-            not self._data
-            or not hasattr(self._data, "files")
-            or not self._data.files
-        ):
+        if not self._data or not self._data.files:
             return
 
-        for file_model in self._data.files:
-            # Check if this file is marked as transparent in annotations
-            is_transparent = False
-            if hasattr(self._data, "annotations"):
-                for annotation in self._data.annotations:
-                    if file_model.id == annotation.transparent:
-                        is_transparent = True
-                        break
+        # Skip files marked as transparent in annotations
+        transparent = {
+            annotation.transparent
+            for annotation in self._data.annotations or []
+        }
+        files = [f for f in self._data.files if f.id not in transparent]
 
-            if is_transparent:
-                continue
-            # Check if file has local_path
-            if not hasattr(file_model, "local_path"):
-                continue
+        # Get the text field width to scale images accordingly
+        text_field_width = self.text_field.width()
+        # Account for margins/padding and spacing between multiple images
+        # Each image spacing is 4px (from layout_spacing)
+        spacing_total = (len(files) - 1) * 4
+        max_image_width = max(
+            int((text_field_width - spacing_total) / len(files))
+            if files
+            else 400,
+            100,  # Minimum width for images
+        )
 
+        for file_model in files:
             # Check if path exists
             if not Path(file_model.local_path).exists():
                 continue
 
-            # Get the text field width to scale images accordingly
-            text_field_width = self.text_field.width()
-            # Account for margins/padding and spacing between multiple images
-            # Calculate how many images we'll have (not transparent)
-            image_count = sum(
-                1
-                for file in self._data.files
-                if not any(
-                    file.id == annotation.transparent
-                    for annotation in (self._data.annotations or [])
-                )
-            )
-            # Each image spacing is 4px (from layout_spacing)
-            spacing_total = (image_count - 1) * 4
-            max_image_width = max(
-                int((text_field_width - spacing_total) / image_count)
-                if image_count > 0
-                else 400,
-                100,  # Minimum width for images
-            )
-
-            thumb_path = getattr(file_model, "thumb_local_path", None)
-
             # Create image widget with dynamic width matching text field
             image_widget = AYImageAttachment(
                 parent=self,
                 image_path=file_model.local_path,
-                thumb_path=thumb_path,
+                thumb_path=file_model.thumb_local_path,
                 max_width=max_image_width,
                 max_height=800,
             )
@@ -707,6 +856,8 @@ class AYComment(AYContainer):
         Save/Cancel."""
         self._show_edit_buttons(False)
         self.text_field.setReadOnly(False)
+        if not self._save_buttons_built:
+            self._build_save_buttons()
         self.cancel_edit.setVisible(True)
         self.save_edit.setVisible(True)
 
@@ -727,19 +878,23 @@ class AYComment(AYContainer):
         self.comment_edited.emit(self._data)
 
     def _confirm_delete(self):
-        mb = QMessageBox(
-            text="Are you sure you want to delete this comment?",
-            standardButtons=QMessageBox.StandardButton.Cancel
+        answer = _exec_message_box(
+            self,
+            "Are you sure you want to delete this comment?",
+            buttons=QMessageBox.StandardButton.Cancel
             | QMessageBox.StandardButton.Yes,  # type: ignore
-            parent=self,
         )
-        if mb.exec() == QMessageBox.StandardButton.Yes:
+        if answer == QMessageBox.StandardButton.Yes:
             self.comment_deleted.emit(self._data)
 
     def _show_edit_buttons(self, state):
         """show / hide edit buttons and position them."""
         if not self.text_field.isReadOnly():
             return
+        if not self._edit_buttons_built:
+            if not state:
+                return
+            self._build_edit_buttons()
         self.edit_frame.setVisible(state)
         if state:
             fr = self.edit_frame.rect()
@@ -757,6 +912,14 @@ class AYComment(AYContainer):
         )
         self.top_line.insert_widget(0, cat)
 
+    def showEvent(self, event: QShowEvent) -> None:
+        # attachments are only loaded once the comment is shown, which also
+        # gives them the actual text field width.
+        if not self._attachments_built:
+            self._attachments_built = True
+            self._build_image_attachments()
+        return super().showEvent(event)
+
     def enterEvent(self, event: QEnterEvent) -> None:
         self._show_edit_buttons(True)
         return super().enterEvent(event)
@@ -774,6 +937,32 @@ class AYComment(AYContainer):
             self.date.setText(self._data.short_date)
 
 
+_prewarmed = False
+
+
+def prewarm() -> None:
+    """Load Qt's markdown parser and font caches ahead of the first comment.
+
+    The first markdown document built in a process is much slower than the
+    next ones. Applications can call this from their startup sequence. It is
+    also scheduled when this module is imported in a running application,
+    and only does the work once.
+    """
+    global _prewarmed
+    if _prewarmed:
+        return
+    _prewarmed = True
+    doc = QTextDocument()
+    doc.setMarkdown("**x** [_y_](https://a) @user", MD_DIALECT)
+    doc.toMarkdown(MD_DIALECT)
+    doc.size()  # runs the layout
+    QFontMetrics(QFont()).lineSpacing()
+
+
+if QApplication.instance() is not None:
+    QTimer.singleShot(0, prewarm)
+
+
 if __name__ == "__main__":
     from ..tester import Style, test
     from .container import AYContainer
@@ -587,6 +587,10 @@ def format_comment_on_change(text_edit: QTextEdit) -> None:
     p_all = f"{p_user}|{p_version}|{p_task}|{p_link}|{p_raw_link}"
     matches = list(re.finditer(p_all, md))
 
+    # Group the format changes in a single edit: one layout update and one
+    # undo step instead of one per mention.
+    cursor.beginEditBlock()
+
     # Clear all formatting first
     cursor.select(QTextCursor.SelectionType.Document)
     cursor.setCharFormat(normal_format)
@@ -639,5 +643,7 @@ def format_comment_on_change(text_edit: QTextEdit) -> None:
                 xtra += len(val) - len(link_name) + 1
                 cursor.setCharFormat(url_format)
 
+    cursor.endEditBlock()
+
     # Restore original cursor position
     text_edit.document().blockSignals(False)
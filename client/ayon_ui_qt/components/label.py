@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
 from qtpy import QtWidgets
 from qtpy.QtCore import QRect, QSize, Qt
 from qtpy.QtGui import (
@@ -12,6 +14,7 @@ from qtpy.QtGui import (
     QPaintEvent,
     QPalette,
     QPen,
+    QPixmap,
 )
 
 try:
@@ -24,6 +27,14 @@ from ..color_utils import compute_color_for_contrast
 from ..variants import QLabelVariants
 
 
+@lru_cache(maxsize=128)
+def _icon_pixmap(name: str, color: str, size: int) -> QPixmap:
+    """Return a shared colored icon pixmap, so labels showing the same icon
+    (e.g. status rows of a feed) don't render the symbol again."""
+    icn: QIcon = get_icon(name, color=color)
+    return icn.pixmap(QSize(size, size))
+
+
 class AYLabel(QtWidgets.QLabel):
     Variants = QLabelVariants
 
@@ -82,8 +93,9 @@ class AYLabel(QtWidgets.QLabel):
                 self._icon_color
                 or self.palette().color(self.foregroundRole()).name()
             )
-            icn: QIcon = get_icon(self._icon, color=icon_color)
-            self.setPixmap(icn.pixmap(QSize(self._icon_size, self._icon_size)))
+            self.setPixmap(
+                _icon_pixmap(self._icon, icon_color, self._icon_size)
+            )
 
     def _ensure_font_setup(self) -> None:
         """Initialize font configuration on first paint."""
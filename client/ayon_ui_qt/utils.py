@@ -18,6 +18,11 @@ from .data_models import (
 )
 from qtpy.QtGui import QColor
 
+try:
+    from orjson import loads as _json_loads  # type: ignore
+except ImportError:
+    _json_loads = json.loads
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -64,21 +69,22 @@ def process_activity_data(
     ui_data = []
     nothing = "Not available"
     for act in activities:
-        act_data = act.get("activityData", {})
+        get = act.get
+        act_data = get("activityData", {})
         if isinstance(act_data, str):
-            act_data = json.loads(act_data)
+            act_data = _json_loads(act_data)
             act["activityData"] = act_data
 
-        activity_type = act.get("activityType", "")
+        activity_type = get("activityType", "")
         activity_id = act["activityId"]
 
-        user_name = act.get("author", {}).get("name", nothing)
+        user_name = get("author", {}).get("name", nothing)
         user_full_name = user_name
         user = users.get(user_name)
         if user:
             user_full_name = user.full_name
 
-        date = act.get("updatedAt", nothing)
+        date = get("updatedAt", nothing)
 
         if activity_type == "comment":
             annotation_models = _parse_annotations(act_data, nothing)
@@ -88,7 +94,7 @@ def process_activity_data(
                     activity_id=activity_id,
                     user_full_name=user_full_name,
                     user_name=user_name,
-                    comment=act.get("body", nothing),
+                    comment=get("body", nothing),
                     comment_date=date,
                     files=file_models,
                     annotations=annotation_models,
@@ -110,7 +116,6 @@ def process_activity_data(
                 )
             )
         elif activity_type == "status.change":
-            print(act.get("activityData", {}).get("oldValue", nothing))
             ui_data.append(
                 StatusChangeModel(
                     activity_id=activity_id,
@@ -129,32 +134,26 @@ def process_activity_data(
 
 def _parse_files(act, nothing):
     """Attached files to comment activities."""
-    files = act.get("files", [])
-    file_models = []
-    for file_info in files:
-        file_models.append(
-            FileModel(
-                id=file_info.get("id", nothing),
-                mime=file_info.get("mime", nothing),
-            )
+    return [
+        FileModel(
+            id=file_info.get("id", nothing),
+            mime=file_info.get("mime", nothing),
         )
-    return file_models
+        for file_info in act.get("files", [])
+    ]
 
 
 def _parse_annotations(act_data, nothing):
     """Attached annotations to comment activities."""
-    annotation_models = []
-    annotations = act_data.get("annotations", [])
-    for annotation in annotations:
-        annotation_models.append(
-            AnnotationModel(
-                id=annotation.get("id", nothing),
-                range=annotation.get("range", nothing),
-                composite=annotation.get("composite", nothing),
-                transparent=annotation.get("transparent", nothing),
-            )
+    return [
+        AnnotationModel(
+            id=annotation.get("id", nothing),
+            range=annotation.get("range", nothing),
+            composite=annotation.get("composite", nothing),
+            transparent=annotation.get("transparent", nothing),
         )
-    return annotation_models
+        for annotation in act_data.get("annotations", [])
+    ]
 
 
 def clear_layout(layout):
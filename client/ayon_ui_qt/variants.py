@@ -151,7 +151,8 @@ if __name__ == "__main__":
             enum = globals()[enum_name]
             if set(json_variants) != {v.value for v in enum}:
                 report += (
-                    f"    Desync for {widget}: {json_variants} != {enum}\n"
+                    f"    Desync for {widget}: "
+                    f"{list(json_variants)} != {enum}\n"
                 )
                 enum_desync = True
 
@@ -26,14 +26,17 @@ from __future__ import annotations
 import argparse
 import collections
 import io
+import json
 import logging
 import os
 import platform
+import pprint
 import re
 import shutil
 import subprocess
 import sys
 import zipfile
+import zlib
 from pathlib import Path
 from typing import Iterable, Optional, Pattern, Tuple, Union
 
@@ -215,6 +218,35 @@ def update_client_version(addon_client_dir: str, log: logging.Logger) -> None:
     Path(version_path).write_text(VERSION_PY_CONTENT, encoding="utf-8")
 
 
+def update_client_style_data(
+    addon_client_dir: str, log: logging.Logger
+) -> None:
+    """Write ayon_style.json as a python module next to it.
+
+    Importing a dict literal is cheaper than parsing the json at startup.
+    The module stores a checksum of the source json, so the client falls
+    back to the json file if the two ever get out of sync.
+    """
+    if not addon_client_dir:
+        return
+
+    client_dir: str = os.path.join(CLIENT_ROOT, addon_client_dir)
+    json_path: str = os.path.join(client_dir, "ayon_style.json")
+    if not os.path.exists(json_path):
+        return
+
+    raw: bytes = Path(json_path).read_bytes()
+    content: str = (
+        '"""Generated from ayon_style.json by create_package.py."""\n'
+        f"SOURCE_CRC32 = {zlib.crc32(raw)}\n"
+        f"DATA = {pprint.pformat(json.loads(raw), sort_dicts=False)}\n"
+    )
+    log.info("Updating client style data")
+    Path(client_dir, "ayon_style_data.py").write_text(
+        content, encoding="utf-8"
+    )
+
+
 def build_frontend() -> None:
     """Build frontend code using yarn.
 
@@ -463,6 +495,7 @@ def main(
             )
             raise RuntimeError(msg)
         update_client_version(addon_client_dir, log)
+        update_client_style_data(addon_client_dir, log)
 
     if only_client:
         if not addon_client_dir: